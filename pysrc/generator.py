@@ -0,0 +1,151 @@
+"""Provides lazily materialized, generator-defined test inputs.
+
+A test may describe its input as a generator program plus arguments instead of
+storing the data, e.g. `{"generator": {"source": "gen.cpp", "args": ["1000000",
+"seed=42"]}}`. The generator is compiled once, run on first use, and its output
+is cached on disk keyed by the hash of (generator artifact, arguments). Cached
+inputs are evicted least-recently-used first once the cache exceeds its budget.
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import threading
+from pathlib import Path
+
+from loguru import logger
+
+from .langs import lang_artifacts, lang_compilers, type_mp
+from .runner import run
+from .utils import atomic_write_text, file_sha256
+
+DEFAULT_BUDGET = 1024**3  # 1 GiB
+
+
+class GeneratorCache:
+    """Materialize generator-defined inputs into a size-bounded disk cache.
+
+    Args:
+        cache_dir (Path): Directory holding cached inputs.
+        budget (int): Maximum total size of cached inputs in bytes.
+
+    """
+
+    def __init__(self, cache_dir: Path, budget: int = DEFAULT_BUDGET) -> None:
+        """Initialize the GeneratorCache."""
+        self.cache_dir = cache_dir
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._compiled: dict[Path, int] = {}
+
+    def materialize(
+        self,
+        source: Path,
+        args: list[str],
+        *,
+        memory_limit: int = 1024,
+        timeout: int = 10,
+    ) -> Path:
+        """Return the path of the cached input, generating it if needed.
+
+        Args:
+            source (Path): Generator source file.
+            args (list[str]): Command-line arguments for the generator.
+            memory_limit (int): Memory limit for the generator in MB.
+            timeout (int): Timeout for the generator in seconds.
+
+        Returns:
+            Path: Path to the cached input file.
+
+        Raises:
+            ValueError: If the generator language is not supported.
+            RuntimeError: If the generator does not finish successfully.
+
+        """
+        lang = type_mp.get(source.suffix.lower(), {})
+        lang_id = lang.get("id")
+        if lang_id not in lang_compilers:
+            msg = f"Generator language for {source.name} is not supported."
+            raise ValueError(msg)
+        artifact = self._compile(source, lang_id)
+        key = self.cache_key(artifact, args)
+        target = self.cache_dir / f"{key}.in"
+        with self._key_lock(key):
+            if target.exists():
+                os.utime(target)  # mark as recently used
+                return target
+            # Escape braces so arguments are not treated as command placeholders
+            escaped = [a.replace("{", "{{").replace("}", "}}") for a in args]
+            result = run(
+                source,
+                "",
+                [*shlex.split(lang.get("runCommand", "")), *escaped],
+                executable=lang.get("executable", ""),
+                memory_limit=memory_limit,
+                timeout=timeout,
+            )
+            if result.type != "success":
+                msg = f"Generator {source.name} failed ({result.type}): {result.output}"
+                raise RuntimeError(msg)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(target, result.output)
+        logger.debug(f"Generated input {target} with {source.name} {args}")
+        self.evict(keep=target)
+        return target
+
+    @staticmethod
+    def cache_key(artifact: Path, args: list[str]) -> str:
+        """Compute the cache key for a generator artifact and its arguments.
+
+        Args:
+            artifact (Path): The compiled generator (or its source).
+            args (list[str]): Command-line arguments.
+
+        Returns:
+            str: Hex digest identifying the generated input.
+
+        """
+        h = hashlib.sha256(file_sha256(artifact).encode("ascii"))
+        h.update(json.dumps(list(args)).encode("utf-8"))
+        return h.hexdigest()
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Delete least recently used inputs until the cache fits its budget.
+
+        Args:
+            keep (Path | None): A file that must not be evicted.
+
+        """
+        with self._lock:
+            if not self.cache_dir.exists():
+                return
+            entries = []
+            for f in self.cache_dir.glob("*.in"):
+                try:
+                    st = f.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, f))
+            total = sum(size for _, size, _ in entries)
+            for _, size, f in sorted(entries, key=lambda e: e[0]):
+                if total <= self.budget:
+                    break
+                if f == keep:
+                    continue
+                f.unlink(missing_ok=True)
+                total -= size
+                logger.debug(f"Evicted generated input {f}")
+
+    def _compile(self, source: Path, lang_id: str) -> Path:
+        mtime = source.stat().st_mtime_ns
+        with self._key_lock(str(source)):
+            if self._compiled.get(source) != mtime:
+                lang_compilers[lang_id](source)
+                self._compiled[source] = mtime
+        return lang_artifacts[lang_id](source)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
@@ -0,0 +1,178 @@
+"""Provides bulk import of testcase packages.
+
+A package is a directory or a zip archive containing input/answer file pairs
+such as `01.in`/`01.out`, `1.in`/`1.ans` or Polygon-style `01`/`01.a`. Pairs are
+matched by stem and copied concurrently into a data directory, producing
+file-backed CPH test entries.
+
+Functions:
+- scan_package: Lists the input/answer pairs of a package.
+- import_package: Copies the pairs into a data directory and returns CPH tests.
+"""
+
+import re
+import shutil
+import threading
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+from typing import NamedTuple
+
+import psutil
+
+INPUT_SUFFIXES = (".in", ".input", ".inp")
+ANSWER_SUFFIXES = (".out", ".ans", ".a", ".output", ".ok", ".sol")
+
+
+class TestFilePair(NamedTuple):
+    """Represents one test found in a package.
+
+    Attributes:
+        key (str): Stem the two files were matched by (including subdirectory).
+        input (str): Path of the input file inside the package.
+        answer (str | None): Path of the answer file, or None if there is none.
+
+    """
+
+    key: str
+    input: str
+    answer: str | None
+
+
+def _natural_key(text: str) -> list[int | str]:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", text)]
+
+
+def _classify(name: str) -> tuple[str, str] | None:
+    """Split a package member name into its stem and role.
+
+    Args:
+        name (str): POSIX-style relative path of the member.
+
+    Returns:
+        tuple[str, str] | None: (stem, "input" | "answer"), or None if unrelated.
+
+    """
+    p = PurePosixPath(name)
+    suffix = p.suffix.lower()
+    stem = str(p.with_suffix(""))
+    if suffix in INPUT_SUFFIXES:
+        return stem, "input"
+    if suffix in ANSWER_SUFFIXES:
+        return stem, "answer"
+    if not suffix and p.name.isdigit():
+        # Polygon packages name inputs "01" and answers "01.a"
+        return str(p), "input"
+    return None
+
+
+def _list_members(source: Path) -> list[str]:
+    if source.is_dir():
+        return [
+            f.relative_to(source).as_posix() for f in source.rglob("*") if f.is_file()
+        ]
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            return [i.filename for i in zf.infolist() if not i.is_dir()]
+    msg = f"{source} is neither a directory nor a zip archive."
+    raise ValueError(msg)
+
+
+def scan_package(source: Path) -> list[TestFilePair]:
+    """List the input/answer pairs of a package, in natural order.
+
+    Args:
+        source (Path): A directory or zip archive.
+
+    Returns:
+        list[TestFilePair]: The pairs found. Answers without inputs are ignored.
+
+    Raises:
+        ValueError: If the source is neither a directory nor a zip archive.
+
+    """
+    inputs: dict[str, str] = {}
+    answers: dict[str, str] = {}
+    for name in _list_members(source):
+        if (classified := _classify(name)) is None:
+            continue
+        stem, role = classified
+        (inputs if role == "input" else answers).setdefault(stem, name)
+    return [
+        TestFilePair(key=stem, input=inputs[stem], answer=answers.get(stem))
+        for stem in sorted(inputs, key=_natural_key)
+    ]
+
+
+def import_package(
+    source: Path,
+    data_dir: Path,
+    *,
+    base_dir: Path,
+    progress: Callable[[int, int], None] | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Copy the tests of a package into `data_dir` using a thread pool.
+
+    Args:
+        source (Path): A directory or zip archive.
+        data_dir (Path): Directory to write `<n>.in`/`<n>.out` files into.
+        base_dir (Path): Directory the returned file references are relative to.
+        progress (Callable[[int, int], None] | None): Called with
+            (completed, total) after each test is copied.
+        max_workers (int | None): Thread pool size; defaults to 2x logical cores.
+
+    Returns:
+        list[dict]: File-backed CPH test entries in package order.
+
+    """
+    pairs = scan_package(source)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    width = max(len(str(len(pairs))), 2)
+    is_zip = not source.is_dir()
+    local = threading.local()
+    opened: list[zipfile.ZipFile] = []
+    opened_lock = threading.Lock()
+
+    def copy_member(name: str, dest: Path) -> None:
+        if not is_zip:
+            shutil.copyfile(source / name, dest)
+            return
+        # ZipFile objects share one file position, so each thread opens its own
+        if (zf := getattr(local, "zf", None)) is None:
+            zf = local.zf = zipfile.ZipFile(source)
+            with opened_lock:
+                opened.append(zf)
+        with zf.open(name) as src, dest.open("wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+    def copy_pair(index: int, pair: TestFilePair) -> dict:
+        name = str(index).zfill(width)
+        entry = {"id": index, "input": "", "output": ""}
+        copy_member(pair.input, data_dir / f"{name}.in")
+        entry["inputFile"] = (data_dir / f"{name}.in").relative_to(base_dir).as_posix()
+        if pair.answer is not None:
+            copy_member(pair.answer, data_dir / f"{name}.out")
+            entry["outputFile"] = (
+                (data_dir / f"{name}.out").relative_to(base_dir).as_posix()
+            )
+        return entry
+
+    if max_workers is None:
+        max_workers = max((psutil.cpu_count(logical=True) or 1) * 2, 4)
+    entries: list[dict | None] = [None] * len(pairs)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(copy_pair, i, pair): i - 1
+                for i, pair in enumerate(pairs, start=1)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                entries[futures[future]] = future.result()
+                if progress is not None:
+                    progress(done, len(pairs))
+    finally:
+        for zf in opened:
+            zf.close()
+    return [e for e in entries if e is not None]
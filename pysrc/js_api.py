@@ -8,7 +8,10 @@ import json
 import platform
 import shlex
 import subprocess
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import psutil
@@ -16,8 +19,12 @@ from loguru import logger
 
 from .config import config, config_p, merge_meta
 from .config_meta import config_meta
-from .judge import cph2testcase, task_checker
+from .generator import GeneratorCache
+from .importer import import_package
+from .judge import cph2testcase, judge_workers, task_checker  # noqa: F401
 from .langs import lang_compilers, lang_runners, langs, type_mp
+from .session import JudgeSession
+from .testcase import TestcaseStore, read_field, testcase_summary
 from .user_data import user_data_dir
 from .utils import formatter as fmt
 from .watch import Watcher
@@ -46,6 +53,8 @@ class Api:
         )
 
         self.opened_testcase_file = None
+        self._testcase_store: TestcaseStore | None = None
+        self.generator_cache = GeneratorCache(user_data_dir / "generated")
         self.watcher: Watcher = Watcher(self._callback)
 
     def _callback(self, path: str) -> None:
@@ -61,21 +70,38 @@ class Api:
             return
         if not Path(path).exists():
             return
+        if self._dispatch_event(
+            "file-changed",
+            self.opened_file.read_text(encoding="utf-8"),
+        ):
+            logger.debug("File change event dispatched.")
+
+    def _dispatch_event(self, name: str, detail: object) -> bool:
+        """Dispatch a CustomEvent on the frontend window.
+
+        Args:
+            name (str): Event name.
+            detail (object): JSON-serializable event detail.
+
+        Returns:
+            bool: True if the event was sent, False if there is no window.
+
+        """
         from .web import window
 
         if window is None:
-            return
+            return False
 
-        j = json.dumps({"detail": self.opened_file.read_text(encoding="utf-8")})
+        j = json.dumps({"detail": detail})
         window.run_js(
             f"""window.dispatchEvent(
                     new CustomEvent(
-                        'file-changed', {j}
+                        '{name}', {j}
                     )
                 );
             """,
         )
-        logger.debug("File change event dispatched.")
+        return True
 
     def _build_path_hashes(self, paths: list[Path]) -> dict[str, int]:
         hashes: dict[str, int] = {}
@@ -311,18 +337,88 @@ class Api:
             dict: Result dictionary with output, status, time, and memory.
 
         """
-        code = self.get_code()
-        lang = code.get("type", None)
+        lang = self._get_runner_lang()
+        task = self.get_testcase().get("tests", [{}])[task_id - 1]
+        return self._judge_task(task, lang, memory_limit, timeout)
+
+    def run_all(self, memory_limit: int = 256, timeout: int = 1) -> dict:
+        """Run every test case for the opened code file with subtask scoring.
+
+        Tests run on a worker pool. When a test of a subtask fails, the rest
+        of that subtask and of the subtasks depending on it are skipped, and
+        running ones are killed. Each result is also sent to the frontend as a
+        "judge-progress" event as soon as it is known.
+
+        Args:
+            memory_limit (int): Memory limit in MB.
+            timeout (int): Timeout in seconds.
+
+        Returns:
+            dict: Per-test results, per-subtask scores and the total score.
+
+        """
+        lang = self._get_runner_lang()
+        testcase = self.get_testcase()
+        session = JudgeSession(
+            testcase.get("tests", []),
+            lambda task, cancel: self._judge_task(
+                task,
+                lang,
+                memory_limit,
+                timeout,
+                cancel,
+            ),
+            subtasks=testcase.get("subtasks"),
+            workers=judge_workers(),
+            on_result=lambda result: self._dispatch_event("judge-progress", result),
+        )
+        return session.run()
+
+    def _get_runner_lang(self) -> str:
+        """Get the language ID of the opened file, checking that it can run.
+
+        Returns:
+            str: The language ID.
+
+        Raises:
+            ValueError: If the language has no runner.
+
+        """
+        lang = self.get_code().get("type", None)
         if lang not in lang_runners:
             msg = f"Language {lang} is not supported."
             raise ValueError(msg)
-        task = self.get_testcase().get("tests", [{}])[task_id - 1]
-        inp = task.get("input", "")
+        return lang
+
+    def _judge_task(
+        self,
+        task: dict,
+        lang: str,
+        memory_limit: int,
+        timeout: int,
+        cancel_event: threading.Event | None = None,
+    ) -> dict:
+        """Run one test and compare its output with the answer.
+
+        Args:
+            task (dict): Test dictionary from the testcase.
+            lang (str): Language ID of the opened file.
+            memory_limit (int): Memory limit in MB.
+            timeout (int): Timeout in seconds.
+            cancel_event (threading.Event | None): Kills the run once set.
+
+        Returns:
+            dict: Result dictionary with output, status, time, and memory.
+
+        """
+        inp = self._get_task_input(task)
+        kwargs = {} if cancel_event is None else {"cancel_event": cancel_event}
         output, status, time, memory = lang_runners[lang](
             self.opened_file,
             inp,
             memory_limit=memory_limit,
             timeout=timeout,
+            **kwargs,
         )
         answer = task.get("answer", "")
         if status == "success":
@@ -334,6 +430,110 @@ class Api:
             "memory": memory,
         }
 
+    def fill_answers(
+        self,
+        reference_path: str | None = None,
+        memory_limit: int = 1024,
+        timeout: int = 10,
+    ) -> dict:
+        """Fill missing answers with the output of a reference solution.
+
+        The reference is compiled once and run over every test without an
+        answer on a worker pool; all outputs are written back in one batch.
+
+        Args:
+            reference_path (str | None): Path to the reference solution, or None
+                to ask the user with a file dialog.
+            memory_limit (int): Memory limit in MB for each run.
+            timeout (int): Timeout in seconds for each run.
+
+        Returns:
+            dict: Status, message, and the filled/failed test IDs.
+
+        """
+        if reference_path is None:
+            reference_path = self._choose_file()
+            if reference_path is None:
+                return {"status": "warning", "message": "No reference selected."}
+        reference = Path(reference_path)
+        lang = type_mp.get(reference.suffix.lower(), {}).get("id")
+        if lang not in lang_runners:
+            msg = f"Language {lang} is not supported."
+            raise ValueError(msg)
+        if lang in lang_compilers:
+            try:
+                lang_compilers[lang](reference)
+            except (FileNotFoundError, ValueError, RuntimeError) as e:
+                return {"status": "error", "message": str(e)}
+        missing = [
+            task
+            for task in self.get_testcase().get("tests", [])
+            if not task.get("answer", "").strip()
+        ]
+
+        def solve(task: dict) -> tuple[int, str, str]:
+            output, status, *_ = lang_runners[lang](
+                reference,
+                self._get_task_input(task),
+                memory_limit=memory_limit,
+                timeout=timeout,
+            )
+            return task["id"], output, status
+
+        updates = []
+        failed = []
+        with ThreadPoolExecutor(max_workers=judge_workers()) as pool:
+            for test_id, output, status in pool.map(solve, missing):
+                if status == "success":
+                    updates.append({"id": test_id, "answer": output})
+                else:
+                    failed.append({"id": test_id, "status": status})
+        if updates:
+            self._require_testcase_store().upsert_tests(updates)
+        logger.info(f"Filled {len(updates)} answers using {reference}")
+        return {
+            "status": "warning" if failed else "success",
+            "message": f"Filled {len(updates)} of {len(missing)} missing answers.",
+            "data": {"filled": [u["id"] for u in updates], "failed": failed},
+        }
+
+    def _choose_file(self) -> str | None:
+        """Ask the user to pick a file with a native dialog.
+
+        Returns:
+            str | None: The chosen path, or None if cancelled or headless.
+
+        """
+        import webview
+
+        from .web import window
+
+        if window is None:
+            return None
+        rst = window.create_file_dialog(
+            webview.FileDialog.OPEN,
+            directory=str(self.opened_file.parent),
+        )
+        return rst[0] if rst else None
+
+    def _get_task_input(self, task: dict) -> str:
+        """Get the input of a test, materializing generator-defined inputs.
+
+        Args:
+            task (dict): Test dictionary from the testcase.
+
+        Returns:
+            str: The test input.
+
+        """
+        if (spec := task.get("generator")) is None:
+            return task.get("input", "")
+        source = self.opened_file.parent / spec["source"]
+        return self.generator_cache.materialize(
+            source,
+            [str(a) for a in spec.get("args", [])],
+        ).read_text(encoding="utf-8")
+
     def get_config(self) -> dict:
         """Get the merged configuration.
 
@@ -361,49 +561,116 @@ class Api:
             return str(e)
         return "success"
 
-    def get_testcase(self) -> dict:
+    def _get_testcase_store(self, *, create: bool = False) -> TestcaseStore | None:
+        """Get the store for the opened file's testcase file.
+
+        Args:
+            create (bool): Use the default `.prob` path if no testcase file exists.
+
+        Returns:
+            TestcaseStore | None: The store, or None if there is no testcase file.
+
+        """
+        if self.opened_testcase_file is None:
+            cph_floder_p = self.opened_file.parent / ".cph"
+            if cph_floder_p.exists():
+                for p in cph_floder_p.iterdir():
+                    if p.name.startswith(
+                        "." + self.opened_file.name + "_",
+                    ) or p.name == ("." + self.opened_file.name + ".prob"):
+                        self.opened_testcase_file = p
+                        break
+        if self.opened_testcase_file is None and create:
+            self.opened_testcase_file = (
+                self.opened_file.parent
+                / ".cph"
+                / ("." + self.opened_file.name + ".prob")
+            )
+        if self.opened_testcase_file is None:
+            return None
+        p = Path(self.opened_testcase_file)
+        if self._testcase_store is None or self._testcase_store.path != p:
+            if self._testcase_store is not None:
+                self._testcase_store.close()
+            self._testcase_store = TestcaseStore(p)
+        return self._testcase_store
+
+    def get_testcase(self, summary: bool = False) -> dict:  # noqa: FBT001, FBT002
         """Get the test cases for the currently opened file.
 
+        Args:
+            summary (bool): Return only ids, sizes, hashes and short previews
+                instead of the full input and answer text.
+
         Returns:
             dict: Test case dictionary.
 
         """
-        none_testcase = {
-            "name": self.opened_file.name,
-            "tests": [],
-            "memoryLimit": 1024,
-            "timeLimit": 3,
-        }
-        if self.opened_testcase_file is not None:
-            return cph2testcase(
-                json.loads(Path(self.opened_testcase_file).read_text(encoding="utf-8")),
-            )
-        cph_floder_p = self.opened_file.parent / ".cph"
-        if not cph_floder_p.exists():
-            return none_testcase
-        for p in cph_floder_p.iterdir():
-            if p.name.startswith("." + self.opened_file.name + "_") or p.name == (
-                "." + self.opened_file.name + ".prob"
-            ):
-                self.opened_testcase_file = p
-                return cph2testcase(json.loads(p.read_text(encoding="utf-8")))
-        return none_testcase
+        testcase = self._get_full_testcase()
+        return testcase_summary(testcase) if summary else testcase
 
-    def save_testcase(self, testcase: dict) -> None:
-        """Save the given test case to the appropriate file.
+    def _require_testcase_store(self, *, create: bool = False) -> TestcaseStore:
+        """Get the testcase store, raising if there is no testcase file.
 
         Args:
-            testcase (dict): Test case dictionary.
+            create (bool): Use the default `.prob` path if no testcase file exists.
+
+        Returns:
+            TestcaseStore: The store.
+
+        Raises:
+            ValueError: If there is no testcase file.
 
         """
-        if self.opened_testcase_file is None:
-            cph_floder_p = self.opened_file.parent / ".cph"
-            cph_floder_p.mkdir(parents=True, exist_ok=True)
-            self.opened_testcase_file = cph_floder_p / (
-                "." + self.opened_file.name + ".prob"
-            )
-        p = self.opened_testcase_file
-        j = {
+        store = self._get_testcase_store(create=create)
+        if store is None:
+            msg = "No testcase file is available."
+            raise ValueError(msg)
+        return store
+
+    def _get_full_testcase(self) -> dict:
+        store = self._get_testcase_store()
+        if store is None:
+            return {
+                "name": self.opened_file.name,
+                "tests": [],
+                "memoryLimit": 1024,
+                "timeLimit": 3,
+            }
+        return store.testcase()
+
+    def get_testcase_content(
+        self,
+        test_id: int,
+        field: str,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> dict:
+        """Get a range of the input or answer of a single test case.
+
+        Args:
+            test_id (int): The test case ID (1-based).
+            field (str): Either "input" or "answer".
+            offset (int): Character offset to start reading from.
+            length (int | None): Number of characters to read, or None for the rest.
+
+        Returns:
+            dict: The requested slice, its offset, the total size and an EOF flag.
+
+        """
+        return read_field(self._get_full_testcase(), test_id, field, offset, length)
+
+    def _new_problem(self, testcase: dict) -> dict:
+        """Build the CPH problem JSON header for the opened file.
+
+        Args:
+            testcase (dict): Test case dictionary providing name and limits.
+
+        Returns:
+            dict: CPH problem JSON without tests.
+
+        """
+        problem = {
             "name": testcase.get("name", self.opened_file.name),
             "memoryLimit": testcase.get("memoryLimit", 1024),
             "timeLimit": testcase.get("timeLimit", 3) * 1000,
@@ -414,15 +681,137 @@ class Api:
             "url": str(self.opened_file),
             "interactive": False,
         }
+        if "subtasks" in testcase:
+            problem["subtasks"] = testcase["subtasks"]
+        return problem
+
+    def save_testcase(self, testcase: dict) -> None:
+        """Save the given test case to the appropriate file.
+
+        Tests that omit "input" or "answer" keep the value currently stored for
+        the test with the same ID, so a frontend holding only summaries can save
+        without sending every test back in full.
+
+        Args:
+            testcase (dict): Test case dictionary.
+
+        """
+        store = self._require_testcase_store(create=True)
+        stored = {}
+        if any(
+            "input" not in test or "answer" not in test
+            for test in testcase.get("tests", [])
+        ):
+            stored = dict(enumerate(store.problem().get("tests", []), start=1))
+        j = self._new_problem(testcase)
         for test in testcase.get("tests", []):
-            j["tests"].append(
-                {
-                    "id": test.get("id", int(time.time() * 1000)),
-                    "input": test.get("input", ""),
-                    "output": test.get("answer", ""),
-                },
-            )
-        p.write_text(json.dumps(j, indent=4), encoding="utf-8")
+            old = stored.get(test.get("id"), {})
+            entry = {"id": test.get("id", int(time.time() * 1000))}
+            if "subtask" in test or "subtask" in old:
+                entry["subtask"] = test.get("subtask", old.get("subtask"))
+            for key, cph_key in (("input", "input"), ("answer", "output")):
+                if key in test:
+                    entry[cph_key] = test[key]
+                else:
+                    entry[cph_key] = old.get(cph_key, "")
+                    if cph_key + "File" in old:
+                        entry[cph_key + "File"] = old[cph_key + "File"]
+                    if cph_key == "input" and "generator" in old:
+                        entry["generator"] = old["generator"]
+            j["tests"].append(entry)
+        store.replace(j)
+
+    def import_testcases(self, path: str) -> dict:
+        """Import a directory or zip of `.in`/`.out` files as file-backed tests.
+
+        Files are copied concurrently into a data directory next to the
+        testcase file and appended to the existing tests. Progress is reported
+        through the `testcase-import-progress` frontend event.
+
+        Args:
+            path (str): Path to the directory or zip archive.
+
+        Returns:
+            dict: Status, message and the number of imported tests.
+
+        """
+        source = Path(path)
+        if not source.exists():
+            msg = f"{source} does not exist."
+            raise FileNotFoundError(msg)
+        store = self._require_testcase_store(create=True)
+        data_dir = (
+            store.path.parent / (store.path.name + ".data") / uuid.uuid4().hex[:8]
+        )
+        last_report = 0.0
+
+        def progress(done: int, total: int) -> None:
+            nonlocal last_report
+            now = time.monotonic()
+            if done == total or now - last_report >= 0.1:  # noqa: PLR2004
+                last_report = now
+                self._dispatch_event(
+                    "testcase-import-progress",
+                    {"done": done, "total": total},
+                )
+
+        entries = import_package(
+            source,
+            data_dir,
+            base_dir=store.path.parent,
+            progress=progress,
+        )
+        problem = store.problem() if store.path.exists() else self._new_problem({})
+        store.replace({**problem, "tests": [*problem.get("tests", []), *entries]})
+        logger.info(f"Imported {len(entries)} tests from {source}")
+        return {
+            "status": "success" if entries else "warning",
+            "message": f"Imported {len(entries)} tests from {source}.",
+            "data": len(entries),
+        }
+
+    def upsert_test(
+        self,
+        test_id: int,
+        inp: str | None = None,
+        answer: str | None = None,
+    ) -> None:
+        """Update a single test case, or append it after the last one.
+
+        The change is journaled and folded into the testcase file in the
+        background, so editing one test does not rewrite the whole suite.
+
+        Args:
+            test_id (int): The test case ID (1-based); one past the last ID appends.
+            inp (str | None): New input, or None to keep the current one.
+            answer (str | None): New answer, or None to keep the current one.
+
+        """
+        store = self._require_testcase_store(create=True)
+        store.upsert_test(test_id, inp, answer)
+
+    def delete_test(self, test_id: int) -> None:
+        """Delete a single test case.
+
+        Args:
+            test_id (int): The test case ID (1-based).
+
+        """
+        store = self._get_testcase_store()
+        if store is None:
+            msg = f"Test {test_id} does not exist."
+            raise ValueError(msg)
+        store.delete_test(test_id)
+
+    def reorder_tests(self, order: list[int]) -> None:
+        """Reorder the test cases.
+
+        Args:
+            order (list[int]): Current test IDs in their new order.
+
+        """
+        store = self._require_testcase_store()
+        store.reorder_tests(order)
 
     def set_config(self, id_str: str, value: str | bool | float) -> None:
         """Set a configuration value.
@@ -531,6 +920,9 @@ class Api:
         self.watcher.create_observer(str(p.parent))
         self.opened_file = p
         self.opened_testcase_file = None
+        if self._testcase_store is not None:
+            self._testcase_store.close()
+            self._testcase_store = None
         self.bin_path = None
 
     def get_opened_file(self) -> str | None:
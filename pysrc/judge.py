@@ -3,8 +3,20 @@
 Functions:
 - task_checker: Compares output with the expected answer for a test case.
 - cph2testcase: Converts CPH problem JSON to a testcase dictionary.
+- judge_workers: Recommends how many tests to run in parallel.
+
+Tests may be file-backed: instead of inline "input"/"output" strings they carry
+"inputFile"/"outputFile" paths relative to the directory of the problem file.
+Tests may also carry a "generator" spec, which is passed through unchanged and
+materialized on first run (see `generator.py`). Tests may name the "subtask"
+they belong to; the problem-level "subtasks" list defines points and
+dependencies (see `session.py`).
 """
 
+from pathlib import Path
+
+import psutil
+
 
 def task_checker(ouput: str, answer: str) -> bool:
     """Check if the output matches the expected answer for a test case.
@@ -24,11 +36,31 @@ def task_checker(ouput: str, answer: str) -> bool:
     return all(i.strip() == j.strip() for i, j in zip(oup, ans, strict=False))
 
 
-def cph2testcase(cph_json: dict) -> dict:
+def read_test_field(test: dict, key: str, base_dir: Path | None = None) -> str:
+    """Read the "input" or "output" of a CPH test, following file references.
+
+    Args:
+        test (dict): A test entry of a CPH problem JSON.
+        key (str): Either "input" or "output".
+        base_dir (Path | None): Directory that file references are relative to.
+
+    Returns:
+        str: The field content.
+
+    """
+    if (ref := test.get(key + "File")) and base_dir is not None:
+        p = base_dir / ref
+        if p.is_file():
+            return p.read_text(encoding="utf-8", errors="replace")
+    return test.get(key, "")
+
+
+def cph2testcase(cph_json: dict, base_dir: Path | None = None) -> dict:
     """Convert a CPH problem JSON to a testcase dictionary.
 
     Args:
         cph_json (dict): The CPH problem JSON.
+        base_dir (Path | None): Directory that file-backed tests are relative to.
 
     Returns:
         dict: A dictionary containing the problem information and test cases.
@@ -36,16 +68,39 @@ def cph2testcase(cph_json: dict) -> dict:
     """
     tests = []
     for i, v in enumerate(cph_json.get("tests", []), start=1):
-        tests.append(
-            {
-                "id": i,
-                "input": v.get("input", ""),
-                "answer": v.get("output", ""),
-            },
-        )
-    return {
+        test = {
+            "id": i,
+            "input": read_test_field(v, "input", base_dir),
+            "answer": read_test_field(v, "output", base_dir),
+        }
+        if "generator" in v:
+            test["generator"] = v["generator"]
+        if "subtask" in v:
+            test["subtask"] = str(v["subtask"])
+        tests.append(test)
+    testcase = {
         "name": cph_json.get("name", "Unnamed"),
         "tests": tests,
         "memoryLimit": cph_json.get("memoryLimit", 1024),
         "timeLimit": cph_json.get("timeLimit", 3000) / 1000,
     }
+    if "subtasks" in cph_json:
+        testcase["subtasks"] = cph_json["subtasks"]
+    return testcase
+
+
+def judge_workers() -> int:
+    """Recommend how many tests to run in parallel on this machine.
+
+    Mirrors the frontend heuristic: 1.5x the physical cores when there is no
+    SMT, otherwise one worker per physical core.
+
+    Returns:
+        int: Number of worker threads (at least 1).
+
+    """
+    physical = psutil.cpu_count(logical=False) or 1
+    logical = psutil.cpu_count(logical=True) or physical
+    if physical == logical:
+        return max(physical * 3 // 2, 1)
+    return physical
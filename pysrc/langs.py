@@ -6,7 +6,7 @@ Defines language metadata, runners, compilers, and type mapping.
 from functools import partial
 
 from .config import config
-from .runner import run, run_compilation
+from .runner import artifact_path, run, run_compilation
 
 lang_config = config["programmingLanguages"]
 lang_cfg_python = lang_config["python"]
@@ -40,6 +40,14 @@ lang_compilers = {
     )
     for key, value in lang_config.items()
 }
+lang_artifacts = {
+    key: partial(
+        artifact_path,
+        cmd=value.get("runCommand", ""),
+        executable=value.get("executable", ""),
+    )
+    for key, value in lang_config.items()
+}
 type_mp = {}
 for lang in langs:
     for key in lang["suffix"] + lang.get("alias", []):
@@ -4,9 +4,12 @@ It includes functions for executing Python and C/C++ code,
 monitoring memory and time usage, and handling compilation errors.
 """
 
+import os
 import platform
 import shlex
+import signal
 import subprocess
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -97,6 +100,48 @@ def get_time(child_process: psutil.Popen) -> float:
         return 0.0
 
 
+def kill_tree(p: psutil.Popen) -> None:
+    """Kill a process started by `run_p` together with everything it spawned.
+
+    On POSIX the process leads its own session, so the whole process group is
+    killed at once; on Windows the descendants are collected and killed.
+
+    Args:
+        p (psutil.Popen): The process to kill.
+
+    """
+    if platform.system() != "Windows":
+        try_r(os.killpg, p.pid, signal.SIGKILL)
+        return
+    for child in try_r(p.children, True, default=[]) or []:  # noqa: FBT003
+        try_r(child.kill)
+    try_r(p.kill)
+
+
+def _limit_status(
+    *,
+    memory: float,
+    memory_limit: int,
+    wall_time: float,
+    cpu_time: float,
+    timeout: int,
+    cancel_event: threading.Event | None,
+) -> str | None:
+    """Decide whether a running process must be killed, and why.
+
+    Returns:
+        str | None: The status to report, or None to keep the process running.
+
+    """
+    if memory > memory_limit:  # check memory
+        return "memory_limit_exceeded"
+    if cancel_event is not None and cancel_event.is_set():
+        return "cancelled"
+    if wall_time >= timeout * 2 or cpu_time >= timeout:  # check timeout
+        return "timeout"
+    return None
+
+
 def run_p(
     cmd: list,
     inp: str = "",
@@ -104,6 +149,7 @@ def run_p(
     memory_limit: int = 256,
     timeout: int = 1,
     cwd: Path | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> RunProcessResult:
     """Run a process with resource limits and capture output.
 
@@ -113,6 +159,7 @@ def run_p(
         memory_limit (int): Memory limit in MB.
         timeout (int): Timeout in seconds.
         cwd (Path | None): Working directory.
+        cancel_event (threading.Event | None): Kill the process once this is set.
 
     Returns:
         RunProcessResult: Result of the process execution.
@@ -122,7 +169,11 @@ def run_p(
     logger.debug(f"Working directory: {cwd}")
     creationflags = 0
     if platform.system() == "Windows":
-        creationflags = int(getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        creationflags = int(getattr(subprocess, "CREATE_NO_WINDOW", 0)) | int(
+            getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+        )
+    # Each run gets its own session (process group) so that helpers it forks
+    # can be killed together with it.
     with psutil.Popen(
         cmd,
         text=True,
@@ -132,6 +183,7 @@ def run_p(
         cwd=cwd,
         creationflags=creationflags,
         shell=platform.system() == "Windows",
+        start_new_session=platform.system() != "Windows",
     ) as p:  # set stdin to -1 for input and stdout stderr to -1 for capture output.
         child_process = p
         try:
@@ -146,6 +198,8 @@ def run_p(
                 state = p.poll()  # check process state
                 cpu_time = max(get_time(child_process), cpu_time)
                 if state is not None:
+                    # Leftover helpers would keep the pipes open
+                    kill_tree(p)
                     stdout = p.stdout.read() if p.stdout is not None else ""
                     stderr = p.stderr.read() if p.stderr is not None else ""
                     return RunProcessResult(
@@ -160,28 +214,20 @@ def run_p(
                     mem_use = mem.uss / (1024**2)
 
                 max_memory = max(max_memory, mem_use)
-                if mem_use > memory_limit:  # check memory
-                    try_r(child_process.kill)
-                    try_r(child_process.terminate)
-                    stdout = p.stdout.read() if p.stdout is not None else ""
-                    stderr = p.stderr.read() if p.stderr is not None else ""
-                    return RunProcessResult(
-                        status="memory_limit_exceeded",
-                        stdout=stdout,
-                        stderr=stderr,
-                        time=cpu_time,
-                        memory=max_memory,
-                    )
-
-                if (
-                    time.monotonic() - start >= timeout * 2 or cpu_time >= timeout
-                ):  # check timeout
-                    try_r(child_process.kill)
-                    try_r(child_process.terminate)
+                status = _limit_status(
+                    memory=mem_use,
+                    memory_limit=memory_limit,
+                    wall_time=time.monotonic() - start,
+                    cpu_time=cpu_time,
+                    timeout=timeout,
+                    cancel_event=cancel_event,
+                )
+                if status is not None:
+                    kill_tree(p)
                     stdout = p.stdout.read() if p.stdout is not None else ""
                     stderr = p.stderr.read() if p.stderr is not None else ""
                     return RunProcessResult(
-                        status="timeout",
+                        status=status,
                         stdout=stdout,
                         stderr=stderr,
                         time=cpu_time,
@@ -194,8 +240,7 @@ def run_p(
                 p.stdout.close()
             if p.stderr is not None:
                 p.stderr.close()
-            try_r(p.kill)
-            try_r(p.terminate)
+            kill_tree(p)
             p.wait()  # wait for process to terminate
 
 
@@ -207,6 +252,7 @@ def run(
     executable: str = "",
     memory_limit: int = 256,
     timeout: int = 1,
+    cancel_event: threading.Event | None = None,
 ) -> Result:
     """Run code with the given command and input.
 
@@ -217,6 +263,7 @@ def run(
         executable (str): Executable name.
         memory_limit (int): Memory limit in MB.
         timeout (int): Timeout in seconds.
+        cancel_event (threading.Event | None): Kill the process once this is set.
 
     Returns:
         Result: Result of code execution.
@@ -236,6 +283,7 @@ def run(
             timeout=timeout,
             memory_limit=memory_limit,
             cwd=file_path.parent,
+            cancel_event=cancel_event,
         )
         stdout = rst.stdout
         stderr = rst.stderr
@@ -246,6 +294,8 @@ def run(
         return Result(output=str(e), type="runtime_error", time=0, memory=0)
     if status == "timeout":
         return Result(output=stdout, type="timeout", time=time, memory=memory)
+    if status == "cancelled":
+        return Result(output=stdout, type="cancelled", time=time, memory=memory)
     if status == "memory_limit_exceeded":
         return Result(
             output=stdout,
@@ -259,6 +309,37 @@ def run(
     return Result(output=stdout, type="success", time=time, memory=memory)
 
 
+def artifact_path(
+    file_path: Path,
+    cmd: list | str,
+    *,
+    executable: str = "",
+) -> Path:
+    """Locate the file a run command actually executes.
+
+    The first argument of the formatted run command that names an existing
+    file (relative to the source directory) is taken as the artifact, e.g. the
+    compiled binary for C++ or the `.pyc` for Python. If no argument names a
+    file, the source itself is returned.
+
+    Args:
+        file_path (Path): Path to the code file.
+        cmd (list | str): Run command.
+        executable (str): Executable name.
+
+    Returns:
+        Path: Path to the artifact.
+
+    """
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+    for c in cmd:
+        p = file_path.parent / fmt(c, file_path=file_path, executable=executable)
+        if p.is_file():
+            return p
+    return file_path
+
+
 def run_compilation(file_path: Path, cmd: list | str, *, executable: str = "") -> None:
     """Compile code using the given command.
 
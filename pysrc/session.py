@@ -0,0 +1,206 @@
+"""Provides the backend judge scheduler.
+
+A judge session runs every test of a problem on a worker pool. Tests may be
+grouped into subtasks: `{"subtasks": [{"name": "2", "points": 30, "depends":
+["1"]}]}` at problem level plus `"subtask": "2"` on each test. Once a test of a
+subtask fails, the remaining tests of that subtask and of every subtask that
+(transitively) depends on it are skipped, and the ones already running are
+cancelled. Points are awarded per subtask when all of its tests pass.
+
+Classes:
+- JudgeSession: Runs the tests of one problem and scores its subtasks.
+
+Functions:
+- subtask_dependents: Maps each subtask to the subtasks that fail with it.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+SKIPPED = "skipped"
+CANCELLED = "cancelled"
+
+RunTest = Callable[[dict, threading.Event], dict]
+
+
+def subtask_dependents(subtasks: list[dict]) -> dict[str, set[str]]:
+    """Map each subtask to the subtasks that cannot pass once it fails.
+
+    Args:
+        subtasks (list[dict]): Subtask definitions with "name" and "depends".
+
+    Returns:
+        dict[str, set[str]]: For each subtask name, itself plus every subtask
+            depending on it directly or transitively.
+
+    Raises:
+        ValueError: If a subtask depends on an unknown subtask.
+
+    """
+    names = {str(s["name"]) for s in subtasks}
+    direct: dict[str, set[str]] = {name: set() for name in names}
+    for s in subtasks:
+        for dep in s.get("depends", []):
+            if str(dep) not in names:
+                msg = f"Subtask {s['name']} depends on unknown subtask {dep}."
+                raise ValueError(msg)
+            direct[str(dep)].add(str(s["name"]))
+    closure = {}
+    for name in names:
+        seen = {name}
+        stack = [name]
+        while stack:
+            for child in direct[stack.pop()]:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        closure[name] = seen
+    return closure
+
+
+class JudgeSession:
+    """Run the tests of one problem with subtask short-circuiting.
+
+    Args:
+        tests (list[dict]): Tests as returned by `cph2testcase`.
+        run_test (RunTest): Judges one test. Receives the test and an event
+            that is set when the test should be cancelled; returns a dict with
+            at least "status" ("success" means accepted).
+        subtasks (list[dict] | None): Subtask definitions, if any.
+        workers (int): Number of tests to run in parallel.
+        on_result (Callable[[dict], None] | None): Called with each result as
+            soon as it is known, including skipped tests.
+
+    """
+
+    def __init__(
+        self,
+        tests: list[dict],
+        run_test: RunTest,
+        *,
+        subtasks: list[dict] | None = None,
+        workers: int = 1,
+        on_result: Callable[[dict], None] | None = None,
+    ) -> None:
+        """Initialize the JudgeSession."""
+        self.subtasks = subtasks or []
+        self.dependents = subtask_dependents(self.subtasks)
+        self.tests = self._order(tests)
+        self.run_test = run_test
+        self.workers = max(workers, 1)
+        self.on_result = on_result
+        self.results: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        self._failed: set[str] = set()
+        self._running: dict[int, tuple[str | None, threading.Event]] = {}
+
+    def run(self) -> dict:
+        """Run all tests and score the subtasks.
+
+        Returns:
+            dict: "results" (per test, in test ID order), "subtasks" (per
+                subtask name, status, points and score) and the total "score".
+
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for future in [pool.submit(self._judge, t) for t in self.tests]:
+                future.result()
+        return self.report()
+
+    def report(self) -> dict:
+        """Summarize the results collected so far.
+
+        Returns:
+            dict: Same structure as `run`.
+
+        """
+        with self._lock:
+            results = [self.results[k] for k in sorted(self.results)]
+            scored = []
+            for s in self.subtasks:
+                name = str(s["name"])
+                members = [r for r in results if r.get("subtask") == name]
+                passed = name not in self._failed and all(
+                    r["status"] == "success" for r in members
+                )
+                points = s.get("points", 0)
+                scored.append(
+                    {
+                        "name": name,
+                        "status": "success" if passed else "failed",
+                        "points": points,
+                        "score": points if passed else 0,
+                    },
+                )
+        return {
+            "results": results,
+            "subtasks": scored,
+            "score": sum(s["score"] for s in scored),
+        }
+
+    def _order(self, tests: list[dict]) -> list[dict]:
+        """Order tests so subtasks run after the subtasks they depend on.
+
+        Failing prerequisites early lets more of their dependents be skipped.
+        """
+        rank: dict[str, int] = {}
+        for s in self.subtasks:
+            # The number of subtasks a failure would drag down orders
+            # prerequisites before their dependents.
+            rank[str(s["name"])] = -len(self.dependents[str(s["name"])])
+        return sorted(
+            tests,
+            key=lambda t: rank.get(str(t.get("subtask")), 0),
+        )
+
+    def _subtask_of(self, test: dict) -> str | None:
+        name = test.get("subtask")
+        if name is None or str(name) not in self.dependents:
+            return None
+        return str(name)
+
+    def _judge(self, test: dict) -> None:
+        subtask = self._subtask_of(test)
+        cancel = threading.Event()
+        with self._lock:
+            skip = subtask in self._failed
+            if not skip:
+                self._running[test["id"]] = (subtask, cancel)
+        if skip:
+            self._publish(test, {"status": SKIPPED})
+            return
+        try:
+            result = self.run_test(test, cancel)
+        except Exception as e:  # noqa: BLE001
+            logger.opt(exception=e).warning(f"Test {test['id']} crashed")
+            result = {"status": "runtime_error", "result": str(e)}
+        finally:
+            with self._lock:
+                self._running.pop(test["id"], None)
+        if cancel.is_set() and result.get("status") in (CANCELLED, "success"):
+            result = {**result, "status": SKIPPED}
+        if subtask is not None and result.get("status") not in ("success", SKIPPED):
+            self._fail(subtask)
+        self._publish(test, result)
+
+    def _fail(self, subtask: str) -> None:
+        with self._lock:
+            doomed = self.dependents[subtask] - self._failed
+            self._failed |= doomed
+            for other, cancel in self._running.values():
+                if other in doomed:
+                    cancel.set()
+        if doomed:
+            logger.debug(f"Subtask {subtask} failed; skipping {sorted(doomed)}")
+
+    def _publish(self, test: dict, result: dict) -> None:
+        result = {**result, "id": test["id"]}
+        if (subtask := self._subtask_of(test)) is not None:
+            result["subtask"] = subtask
+        with self._lock:
+            self.results[test["id"]] = result
+        if self.on_result is not None:
+            self.on_result(result)
@@ -0,0 +1,422 @@
+"""Provides helpers for storing testcase data and reading it without shipping it in full.
+
+The frontend only needs enough information to render the checker panel when a
+file is opened; the full input/answer text is fetched on demand with ranged
+reads once a test is expanded. Edits are appended to a journal next to the CPH
+problem file and compacted into it in the background.
+
+Classes:
+- TestcaseStore: In-memory view of a CPH problem file with journaled edits.
+
+Functions:
+- field_summary: Summarizes one input/answer string (size, hash, preview).
+- testcase_summary: Summarizes every test of a testcase dictionary.
+- read_field: Returns a slice of one test field.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from loguru import logger
+
+from .judge import cph2testcase
+from .utils import atomic_write_text
+
+PREVIEW_LENGTH = 1024
+TESTCASE_FIELDS = ("input", "answer")
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_SEQ_KEY = "tieJournalSeq"
+
+
+def field_summary(text: str, preview_length: int = PREVIEW_LENGTH) -> dict:
+    """Summarize a test field for the frontend.
+
+    Args:
+        text (str): The input or answer text.
+        preview_length (int): Number of characters to include in the preview.
+
+    Returns:
+        dict: Size (in characters), content hash, preview and truncation flag.
+
+    """
+    return {
+        "size": len(text),
+        "hash": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        "preview": text[:preview_length],
+        "truncated": len(text) > preview_length,
+    }
+
+
+def testcase_summary(testcase: dict, preview_length: int = PREVIEW_LENGTH) -> dict:
+    """Replace the tests of a testcase dictionary with their summaries.
+
+    Args:
+        testcase (dict): Testcase dictionary as returned by `cph2testcase`.
+        preview_length (int): Number of characters to include in each preview.
+
+    Returns:
+        dict: A copy of the testcase whose tests only carry summaries.
+
+    """
+    tests = []
+    for test in testcase.get("tests", []):
+        summary = {
+            "id": test["id"],
+            **{
+                field: field_summary(test.get(field, ""), preview_length)
+                for field in TESTCASE_FIELDS
+            },
+        }
+        if "generator" in test:
+            summary["input"]["generator"] = test["generator"]
+        if "subtask" in test:
+            summary["subtask"] = test["subtask"]
+        tests.append(summary)
+    return {**testcase, "tests": tests}
+
+
+def read_field(
+    testcase: dict,
+    test_id: int,
+    field: str,
+    offset: int = 0,
+    length: int | None = None,
+) -> dict:
+    """Read a slice of one field of one test.
+
+    Args:
+        testcase (dict): Testcase dictionary as returned by `cph2testcase`.
+        test_id (int): The test case ID (1-based).
+        field (str): Either "input" or "answer".
+        offset (int): Character offset to start reading from.
+        length (int | None): Number of characters to read, or None for the rest.
+
+    Returns:
+        dict: The requested slice with its position and the total size.
+
+    Raises:
+        ValueError: If the field name or range is invalid.
+        KeyError: If no test has the given ID.
+
+    """
+    if field not in TESTCASE_FIELDS:
+        msg = f"Unknown testcase field: {field}."
+        raise ValueError(msg)
+    if offset < 0 or (length is not None and length < 0):
+        msg = f"Invalid range: offset={offset}, length={length}."
+        raise ValueError(msg)
+    for test in testcase.get("tests", []):
+        if test["id"] == test_id:
+            text = test.get(field, "")
+            end = len(text) if length is None else min(len(text), offset + length)
+            return {
+                "id": test_id,
+                "field": field,
+                "offset": offset,
+                "data": text[offset:end],
+                "size": len(text),
+                "eof": end >= len(text),
+            }
+    msg = f"Test {test_id} does not exist."
+    raise KeyError(msg)
+
+
+class TestcaseStore:
+    """Keep a CPH problem file in memory and persist edits through a journal.
+
+    Every edit is applied in memory and appended as one JSON line to
+    `<problem file>.journal`. A background timer compacts the journal into the
+    problem file with an atomic rename. Journal entries carry a sequence
+    number and the problem file records the last one it contains, so a crash
+    between the two writes never applies an edit twice.
+
+    Args:
+        path (Path): Path to the CPH problem file.
+        compact_delay (float): Seconds to wait after an edit before compacting.
+        compact_threshold (int): Number of pending edits that forces compaction.
+
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        compact_delay: float = 2.0,
+        compact_threshold: int = 256,
+    ) -> None:
+        """Initialize the TestcaseStore."""
+        self.path = path
+        self.journal_path = path.with_name(path.name + JOURNAL_SUFFIX)
+        self.compact_delay = compact_delay
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._problem: dict | None = None
+        self._testcase: dict | None = None
+        self._mtime: int | None = None
+        self._journal: list[dict] = []
+        self._seq = 0
+        self._timer: threading.Timer | None = None
+
+    def problem(self) -> dict:
+        """Get the CPH problem JSON including journaled edits.
+
+        Returns:
+            dict: The CPH problem JSON. Callers must not mutate it.
+
+        """
+        with self._lock:
+            if self._problem is None or (
+                not self._journal and self._file_mtime() != self._mtime
+            ):
+                self._load()
+            return self._problem  # type: ignore[return-value]
+
+    def testcase(self) -> dict:
+        """Get the problem converted to a testcase dictionary.
+
+        Returns:
+            dict: Test case dictionary as returned by `cph2testcase`.
+
+        """
+        with self._lock:
+            problem = self.problem()
+            if self._testcase is None:
+                self._testcase = cph2testcase(problem, self.path.parent)
+            return self._testcase
+
+    def replace(self, problem: dict) -> None:
+        """Replace the whole problem and write it immediately.
+
+        Args:
+            problem (dict): The new CPH problem JSON.
+
+        """
+        with self._write_lock, self._lock:
+            self._cancel_timer()
+            problem = {**problem, JOURNAL_SEQ_KEY: self._seq}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.path, json.dumps(problem, indent=4))
+            self.journal_path.unlink(missing_ok=True)
+            self._journal = []
+            self._set_problem(problem)
+            self._mtime = self._file_mtime()
+
+    def upsert_test(
+        self,
+        test_id: int,
+        inp: str | None = None,
+        answer: str | None = None,
+    ) -> None:
+        """Update one test, or append it if `test_id` is one past the last test.
+
+        Args:
+            test_id (int): The test case ID (1-based).
+            inp (str | None): New input, or None to keep the current one.
+            answer (str | None): New answer, or None to keep the current one.
+
+        """
+        op: dict = {"op": "upsert", "id": test_id}
+        if inp is not None:
+            op["input"] = inp
+        if answer is not None:
+            op["output"] = answer
+        self._record(op)
+
+    def upsert_tests(self, updates: list[dict]) -> None:
+        """Apply several upserts as a single journal entry.
+
+        Args:
+            updates (list[dict]): Dicts with "id" and optional "input"/"answer".
+
+        """
+        ops = []
+        for update in updates:
+            op: dict = {"op": "upsert", "id": update["id"]}
+            if update.get("input") is not None:
+                op["input"] = update["input"]
+            if update.get("answer") is not None:
+                op["output"] = update["answer"]
+            ops.append(op)
+        self._record({"op": "batch", "ops": ops})
+
+    def delete_test(self, test_id: int) -> None:
+        """Delete one test.
+
+        Args:
+            test_id (int): The test case ID (1-based).
+
+        """
+        self._record({"op": "delete", "id": test_id})
+
+    def reorder_tests(self, order: list[int]) -> None:
+        """Reorder the tests.
+
+        Args:
+            order (list[int]): Current test IDs in their new order.
+
+        """
+        self._record({"op": "reorder", "order": list(order)})
+
+    def compact(self) -> None:
+        """Fold the journal into the problem file.
+
+        The problem is serialized outside the lock so edits made meanwhile are
+        not blocked; they stay in the journal for the next compaction.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._cancel_timer()
+                if not self._journal or self._problem is None:
+                    return
+                seq = self._seq
+                snapshot = {
+                    **self._problem,
+                    "tests": list(self._problem.get("tests", [])),
+                    JOURNAL_SEQ_KEY: seq,
+                }
+            atomic_write_text(self.path, json.dumps(snapshot, indent=4))
+            with self._lock:
+                self._mtime = self._file_mtime()
+                self._journal = [op for op in self._journal if op["seq"] > seq]
+                if self._journal:
+                    atomic_write_text(
+                        self.journal_path,
+                        "".join(json.dumps(op) + "\n" for op in self._journal),
+                    )
+                    self._schedule()
+                else:
+                    self.journal_path.unlink(missing_ok=True)
+        logger.debug(f"Compacted testcase journal into {self.path}")
+
+    def close(self) -> None:
+        """Cancel pending timers and compact synchronously."""
+        self.compact()
+
+    def _record(self, op: dict) -> None:
+        with self._lock:
+            problem = self.problem()
+            self._seq += 1
+            op = {"seq": self._seq, **op}
+            self._set_problem(_apply_op(problem, op))
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(op) + "\n")
+            self._journal.append(op)
+            if len(self._journal) >= self.compact_threshold:
+                threading.Thread(target=self.compact, daemon=True).start()
+            else:
+                self._schedule()
+
+    def _load(self) -> None:
+        problem: dict = {"tests": []}
+        if self.path.exists():
+            problem = json.loads(self.path.read_text(encoding="utf-8"))
+        self._mtime = self._file_mtime()
+        applied = int(problem.get(JOURNAL_SEQ_KEY, 0))
+        self._seq = applied
+        self._journal = []
+        for op in self._read_journal():
+            if op["seq"] <= applied:
+                continue
+            self._seq = op["seq"]
+            try:
+                problem = _apply_op(problem, op)
+            except (KeyError, ValueError) as e:
+                logger.opt(exception=e).warning(f"Skipping journal entry {op}")
+                continue
+            self._journal.append(op)
+        self._set_problem(problem)
+        if self._journal:
+            self._schedule()
+
+    def _read_journal(self) -> list[dict]:
+        if not self.journal_path.exists():
+            return []
+        ops = []
+        for line in self.journal_path.read_text(encoding="utf-8").splitlines():
+            try:
+                ops.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"Ignoring truncated journal entry in {self.journal_path}"
+                )
+                break
+        return ops
+
+    def _set_problem(self, problem: dict) -> None:
+        self._problem = problem
+        self._testcase = None
+
+    def _file_mtime(self) -> int | None:
+        try:
+            return self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _schedule(self) -> None:
+        self._cancel_timer()
+        self._timer = threading.Timer(self.compact_delay, self.compact)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+def _apply_op(problem: dict, op: dict) -> dict:
+    """Apply one journal entry to a CPH problem, returning a new problem.
+
+    Args:
+        problem (dict): The CPH problem JSON (left unmodified).
+        op (dict): The journal entry.
+
+    Returns:
+        dict: The updated CPH problem JSON.
+
+    Raises:
+        ValueError: If the entry is invalid for the current tests.
+
+    """
+    kind = op["op"]
+    if kind == "batch":
+        for sub in op["ops"]:
+            problem = _apply_op(problem, {"seq": op["seq"], **sub})
+        return problem
+    tests = list(problem.get("tests", []))
+    if kind == "upsert":
+        index = op["id"] - 1
+        if not 0 <= index <= len(tests):
+            msg = f"Test {op['id']} does not exist."
+            raise ValueError(msg)
+        test = dict(tests[index]) if index < len(tests) else {"input": "", "output": ""}
+        for key in ("input", "output"):
+            if key in op:
+                test[key] = op[key]
+                test.pop(key + "File", None)
+                if key == "input":
+                    test.pop("generator", None)
+        if index < len(tests):
+            tests[index] = test
+        else:
+            tests.append({"id": op["seq"], **test})
+    elif kind == "delete":
+        index = op["id"] - 1
+        if not 0 <= index < len(tests):
+            msg = f"Test {op['id']} does not exist."
+            raise ValueError(msg)
+        del tests[index]
+    elif kind == "reorder":
+        order = op["order"]
+        if sorted(order) != list(range(1, len(tests) + 1)):
+            msg = f"Invalid test order: {order}."
+            raise ValueError(msg)
+        tests = [tests[i - 1] for i in order]
+    else:
+        msg = f"Unknown journal operation: {kind}."
+        raise ValueError(msg)
+    return {**problem, "tests": tests}
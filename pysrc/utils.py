@@ -1,9 +1,14 @@
 """Utility functions for formatting strings with file path details.
 
 This module provides a `formatter` function that formats a string
-using various attributes of a given file path.
+using various attributes of a given file path, `atomic_write_text`
+for replacing files without exposing partially written content, and
+`file_sha256` for content-addressing files.
 """
 
+import hashlib
+import os
+import tempfile
 from pathlib import Path
 
 
@@ -52,3 +57,42 @@ def formatter(val: str, *, file_path: Path, executable: str = "None") -> str:
         fileParentName=fileParentName,
         executable=executable,
     )
+
+
+def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    """Write text to a file atomically.
+
+    The content is written to a temporary file in the same directory and then
+    renamed over the target, so readers see either the old or the new file.
+
+    Args:
+        path (Path): Destination file path.
+        text (str): Text content to write.
+        encoding (str): Text encoding.
+
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    tmp_p = Path(tmp)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_p.replace(path)
+    except BaseException:
+        tmp_p.unlink(missing_ok=True)
+        raise
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's content.
+
+    Args:
+        path (Path): Path to the file.
+
+    Returns:
+        str: Hex digest.
+
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
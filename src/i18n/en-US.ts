@@ -58,6 +58,8 @@ export default {
         runAllStatus: "Run All | Compiling... | Running... | All Done",
         deleteTask: "Delete Task",
         clearAllTasks: "Clear All Tasks",
+        fillAnswers: "Fill Answers from Reference",
+        subtaskScore: "Subtask {name}: {score} / {points}",
         addTask: "Add Task",
         input: "Input",
         answer: "Answer",
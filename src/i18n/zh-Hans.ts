@@ -58,6 +58,8 @@ export default {
         runAllStatus: "运行全部 | 编译中... | 运行中... | 全部完成",
         deleteTask: "删除测试点",
         clearAllTasks: "清空所有测试点",
+        fillAnswers: "用参考解填充答案",
+        subtaskScore: "子任务 {name}：{score} / {points}",
         addTask: "添加测试点",
         input: "输入",
         answer: "答案",
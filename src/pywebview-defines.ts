@@ -94,11 +94,47 @@ export interface Config {
   } & { [key: string]: any }
 }
 
+export interface Subtask {
+  name: string
+  points: number
+  depends?: string[]
+}
 export interface TestCase {
   name: string
-  tests: { id: number; input: string; answer: string }[]
+  tests: { id: number; input: string; answer: string; subtask?: string }[]
+  memoryLimit: number
+  timeLimit: number
+  subtasks?: Subtask[]
+}
+// Tests may omit input/answer to keep the value already stored in the backend
+export interface TestCaseUpdate extends Omit<TestCase, 'tests'> {
+  tests: { id: number; input?: string; answer?: string; subtask?: string }[]
+}
+export interface GeneratorSpec {
+  source: string
+  args?: (string | number)[]
+}
+export interface TestFieldSummary {
+  size: number
+  hash: string
+  preview: string
+  truncated: boolean
+  generator?: GeneratorSpec // only on inputs produced by a generator
+}
+export interface TestCaseSummary {
+  name: string
+  tests: { id: number; input: TestFieldSummary; answer: TestFieldSummary; subtask?: string }[]
   memoryLimit: number
   timeLimit: number
+  subtasks?: Subtask[]
+}
+export interface TestFieldContent {
+  id: number
+  field: 'input' | 'answer'
+  offset: number
+  data: string
+  size: number
+  eof: boolean
 }
 export interface TaskResult {
   result: string
@@ -106,6 +142,23 @@ export interface TaskResult {
   time: number
   memory: number
 }
+// Sent as "judge-progress" events while run_all is running
+export interface JudgeResult extends Partial<TaskResult> {
+  id: number
+  status: string
+  subtask?: string
+}
+export interface SubtaskScore {
+  name: string
+  status: 'success' | 'failed'
+  points: number
+  score: number
+}
+export interface JudgeReport {
+  results: JudgeResult[]
+  subtasks: SubtaskScore[]
+  score: number
+}
 
 export interface API {
   [x: string]: any
@@ -120,8 +173,23 @@ export interface API {
   get_cpu_count: () => Promise<[number, number]>
   compile: () => Promise<'success' | string>
   run_task: (task_id: number, memory_limit?: number, timeout?: number) => Promise<TaskResult>
-  get_testcase: () => Promise<TestCase>
-  save_testcase: (testcase: TestCase) => Promise<void>
+  run_all: (memory_limit?: number, timeout?: number) => Promise<JudgeReport>
+  get_testcase: {
+    (summary: true): Promise<TestCaseSummary>
+    (): Promise<TestCase>
+  }
+  get_testcase_content: (
+    test_id: number,
+    field: 'input' | 'answer',
+    offset?: number,
+    length?: number | null,
+  ) => Promise<TestFieldContent>
+  save_testcase: (testcase: TestCaseUpdate) => Promise<void>
+  import_testcases: (path: string) => Promise<Response>
+  fill_answers: (reference_path?: string | null, memory_limit?: number, timeout?: number) => Promise<Response>
+  upsert_test: (test_id: number, inp?: string | null, answer?: string | null) => Promise<void>
+  delete_test: (test_id: number) => Promise<void>
+  reorder_tests: (order: number[]) => Promise<void>
   set_config: (id_str: string, value: string | boolean | number) => Promise<void>
   get_config: () => Promise<Config>
   get_config_path: () => Promise<string>
@@ -1,7 +1,15 @@
 /**
  * 任务服务 - 处理测试任务相关的 API 调用
  */
-import type { TaskResult, TestCase } from "@/pywebview-defines";
+import type {
+  JudgeReport,
+  Response,
+  TaskResult,
+  TestCase,
+  TestCaseSummary,
+  TestCaseUpdate,
+  TestFieldContent,
+} from "@/pywebview-defines";
 import { apiClient, type ApiClient } from "../base/api-client";
 
 export class TaskService {
@@ -34,6 +42,16 @@ export class TaskService {
     );
   }
 
+  /**
+   * 在后端运行全部测试任务，按子任务依赖跳过后续测试
+   * 每个测试的结果会以 "judge-progress" 事件推送
+   * @param memoryLimit 内存限制（MB）
+   * @param timeout 超时时间（秒）
+   */
+  async runAll(memoryLimit?: number, timeout?: number): Promise<JudgeReport> {
+    return this.client.call<JudgeReport>("run_all", memoryLimit, timeout);
+  }
+
   /**
    * 获取测试用例
    */
@@ -41,14 +59,90 @@ export class TaskService {
     return this.client.call<TestCase>("get_testcase");
   }
 
+  /**
+   * 获取测试用例摘要（仅含 ID、大小、哈希与预览）
+   */
+  async getTestcaseSummary(): Promise<TestCaseSummary> {
+    return this.client.call<TestCaseSummary>("get_testcase", true);
+  }
+
+  /**
+   * 按范围读取单个测试用例的输入或答案
+   * @param testId 测试用例 ID
+   * @param field 字段："input" 或 "answer"
+   * @param offset 起始字符偏移
+   * @param length 读取长度（省略则读到末尾）
+   */
+  async getTestcaseContent(
+    testId: number,
+    field: "input" | "answer",
+    offset = 0,
+    length: number | null = null
+  ): Promise<TestFieldContent> {
+    return this.client.call<TestFieldContent>(
+      "get_testcase_content",
+      testId,
+      field,
+      offset,
+      length
+    );
+  }
+
   /**
    * 保存测试用例
    * @param testcase 测试用例数据
    */
-  async saveTestcase(testcase: TestCase): Promise<void> {
+  async saveTestcase(testcase: TestCaseUpdate): Promise<void> {
     await this.client.call<void>("save_testcase", testcase);
   }
 
+  /**
+   * 从目录或 zip 批量导入 .in/.out 测试用例
+   * 进度通过 window 事件 "testcase-import-progress" 报告
+   * @param path 目录或 zip 文件路径
+   */
+  async importTestcases(path: string): Promise<Response> {
+    return this.client.call<Response>("import_testcases", path);
+  }
+
+  /**
+   * 用参考解（暴力解）的输出填充缺失的答案
+   * @param referencePath 参考解路径（省略则弹出文件选择框）
+   */
+  async fillAnswers(referencePath: string | null = null): Promise<Response> {
+    return this.client.call<Response>("fill_answers", referencePath);
+  }
+
+  /**
+   * 增量更新单个测试用例（ID 为最后一个 +1 时追加）
+   * @param testId 测试用例 ID
+   * @param input 新输入（null 表示保持不变）
+   * @param answer 新答案（null 表示保持不变）
+   */
+  async upsertTest(
+    testId: number,
+    input: string | null = null,
+    answer: string | null = null
+  ): Promise<void> {
+    await this.client.call<void>("upsert_test", testId, input, answer);
+  }
+
+  /**
+   * 删除单个测试用例
+   * @param testId 测试用例 ID
+   */
+  async deleteTest(testId: number): Promise<void> {
+    await this.client.call<void>("delete_test", testId);
+  }
+
+  /**
+   * 调整测试用例顺序
+   * @param order 按新顺序排列的测试用例 ID
+   */
+  async reorderTests(order: number[]): Promise<void> {
+    await this.client.call<void>("reorder_tests", order);
+  }
+
   /**
    * 获取 CPU 核心数
    * @returns [物理核心数, 逻辑核心数]
@@ -1,8 +1,8 @@
 import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
-import type { TestCase } from '@/pywebview-defines'
+import type { SubtaskScore, TestCase } from '@/pywebview-defines'
 
-export type TaskStatus = 'null' | 'pending' | 'completed' | 'failed' | 'running'
+export type TaskStatus = 'null' | 'pending' | 'completed' | 'failed' | 'running' | 'skipped'
 
 export interface TaskItem {
   id: number
@@ -13,6 +13,9 @@ export interface TaskItem {
   expend: boolean
   disabledInput: boolean
   disabledAnswer: boolean
+  partialInput?: boolean
+  partialAnswer?: boolean
+  subtask?: string
   time?: number
   memory?: number
 }
@@ -26,6 +29,7 @@ export const useCheckerStore = defineStore('checker', () => {
   const runStatus = ref<RunStatus>(0)
   const completedTasks = ref<number>(0)
   const testcaseInfo = ref<TestCase | null>(null)
+  const subtaskScores = ref<SubtaskScore[]>([])
 
   // Getters
   const progress = computed(() => {
@@ -87,6 +91,10 @@ export const useCheckerStore = defineStore('checker', () => {
     testcaseInfo.value = info
   }
 
+  function setSubtaskScores(scores: SubtaskScore[]) {
+    subtaskScores.value = scores
+  }
+
   function setRunStatus(status: RunStatus) {
     runStatus.value = status
   }
@@ -108,6 +116,7 @@ export const useCheckerStore = defineStore('checker', () => {
       task.memory = undefined
     })
     completedTasks.value = 0
+    subtaskScores.value = []
   }
 
   function collapseAllTasks() {
@@ -129,6 +138,7 @@ export const useCheckerStore = defineStore('checker', () => {
     runStatus.value = 0
     completedTasks.value = 0
     testcaseInfo.value = null
+    subtaskScores.value = []
   }
 
   return {
@@ -138,6 +148,7 @@ export const useCheckerStore = defineStore('checker', () => {
     runStatus,
     completedTasks,
     testcaseInfo,
+    subtaskScores,
     // Getters
     progress,
     isRunning,
@@ -157,6 +168,7 @@ export const useCheckerStore = defineStore('checker', () => {
     clearTasks,
     setTestcaseName,
     setTestcaseInfo,
+    setSubtaskScores,
     setRunStatus,
     resetRunStatus,
     incrementCompleted,
@@ -0,0 +1,148 @@
+"""Unit tests for the generator module.
+
+This module contains unit tests for GeneratorCache. Compilation and execution
+are mocked so no generator is actually built or run.
+"""
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pysrc.generator import GeneratorCache
+from pysrc.runner import Result
+
+
+@pytest.fixture
+def mocked_lang(tmp_path: Path) -> Generator[dict[str, MagicMock], None, None]:
+    """Mock language tables so `.py` generators compile and run via mocks."""
+    artifact = tmp_path / "gen.pyc"
+    artifact.write_bytes(b"artifact")
+    mocks = {
+        "compile": MagicMock(),
+        "run": MagicMock(
+            side_effect=lambda *args, **kwargs: Result(
+                output=" ".join(args[2][2:]),
+                type="success",
+                time=0,
+                memory=0,
+            ),
+        ),
+    }
+    lang = {"id": "python", "runCommand": "{executable} gen.pyc", "executable": "py"}
+    with (
+        patch("pysrc.generator.type_mp", {".py": lang}),
+        patch("pysrc.generator.lang_compilers", {"python": mocks["compile"]}),
+        patch("pysrc.generator.lang_artifacts", {"python": lambda _: artifact}),
+        patch("pysrc.generator.run", mocks["run"]),
+    ):
+        yield mocks
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """Create a dummy generator source file."""
+    p = tmp_path / "gen.py"
+    p.write_text("print(1)", encoding="utf-8")
+    return p
+
+
+class TestGeneratorCache:
+    """Tests for the GeneratorCache class."""
+
+    def test_materialize_generates_once(
+        self,
+        tmp_path: Path,
+        source: Path,
+        mocked_lang: dict[str, MagicMock],
+    ) -> None:
+        """Test that an input is generated on first use and then reused."""
+        cache = GeneratorCache(tmp_path / "cache")
+
+        first = cache.materialize(source, ["100", "seed=42"])
+        second = cache.materialize(source, ["100", "seed=42"])
+
+        assert first == second
+        assert first.read_text(encoding="utf-8") == "100 seed=42"
+        assert mocked_lang["run"].call_count == 1
+        assert mocked_lang["compile"].call_count == 1
+
+    def test_different_args_different_inputs(
+        self,
+        tmp_path: Path,
+        source: Path,
+        mocked_lang: dict[str, MagicMock],
+    ) -> None:
+        """Test that different arguments produce distinct cache entries."""
+        cache = GeneratorCache(tmp_path / "cache")
+
+        a = cache.materialize(source, ["1"])
+        b = cache.materialize(source, ["2"])
+
+        assert a != b
+        assert mocked_lang["compile"].call_count == 1
+
+    def test_braces_are_escaped(
+        self,
+        tmp_path: Path,
+        source: Path,
+        mocked_lang: dict[str, MagicMock],
+    ) -> None:
+        """Test that braces in arguments are escaped for the command formatter."""
+        cache = GeneratorCache(tmp_path / "cache")
+
+        cache.materialize(source, ["{x}"])
+
+        cmd = mocked_lang["run"].call_args.args[2]
+        assert cmd[-1] == "{{x}}"
+
+    def test_generator_failure(
+        self,
+        tmp_path: Path,
+        source: Path,
+        mocked_lang: dict[str, MagicMock],
+    ) -> None:
+        """Test that a failing generator raises RuntimeError and caches nothing."""
+        mocked_lang["run"].side_effect = None
+        mocked_lang["run"].return_value = Result("boom", "runtime_error", 0, 0)
+        cache = GeneratorCache(tmp_path / "cache")
+
+        with pytest.raises(RuntimeError, match="runtime_error"):
+            cache.materialize(source, ["1"])
+        assert not list((tmp_path / "cache").glob("*.in"))
+
+    def test_unsupported_language(self, tmp_path: Path) -> None:
+        """Test that unknown generator languages raise ValueError."""
+        cache = GeneratorCache(tmp_path / "cache")
+
+        with patch("pysrc.generator.type_mp", {}):
+            with pytest.raises(ValueError, match="not supported"):
+                cache.materialize(tmp_path / "gen.xyz", [])
+
+    def test_evict_least_recently_used(self, tmp_path: Path) -> None:
+        """Test that the oldest inputs are evicted first."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        for i, name in enumerate(("old", "mid", "new")):
+            f = cache_dir / f"{name}.in"
+            f.write_bytes(b"x" * 10)
+            os.utime(f, ns=(i * 10**9, i * 10**9))
+        cache = GeneratorCache(cache_dir, budget=20)
+
+        cache.evict()
+
+        assert sorted(f.stem for f in cache_dir.glob("*.in")) == ["mid", "new"]
+
+    def test_evict_keeps_requested_file(self, tmp_path: Path) -> None:
+        """Test that the file just generated is never evicted."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        big = cache_dir / "big.in"
+        big.write_bytes(b"x" * 100)
+        cache = GeneratorCache(cache_dir, budget=10)
+
+        cache.evict(keep=big)
+
+        assert big.exists()
@@ -0,0 +1,110 @@
+"""Unit tests for the importer module.
+
+This module contains unit tests for scanning and importing testcase packages
+from directories and zip archives.
+"""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from pysrc import importer
+
+
+def _make_dir_package(root: Path) -> Path:
+    package = root / "package"
+    (package / "tests").mkdir(parents=True)
+    for i in (1, 2, 10):
+        (package / "tests" / f"{i}.in").write_text(f"in{i}", encoding="utf-8")
+        (package / "tests" / f"{i}.out").write_text(f"out{i}", encoding="utf-8")
+    (package / "README.md").write_text("ignored", encoding="utf-8")
+    return package
+
+
+class TestScanPackage:
+    """Tests for the scan_package function."""
+
+    def test_directory_pairs_in_natural_order(self, tmp_path: Path) -> None:
+        """Test that pairs are matched by stem and sorted naturally."""
+        pairs = importer.scan_package(_make_dir_package(tmp_path))
+
+        assert [p.key for p in pairs] == ["tests/1", "tests/2", "tests/10"]
+        assert pairs[0].input == "tests/1.in"
+        assert pairs[0].answer == "tests/1.out"
+
+    def test_polygon_naming(self, tmp_path: Path) -> None:
+        """Test that Polygon-style `01`/`01.a` files are paired."""
+        (tmp_path / "01").write_text("1", encoding="utf-8")
+        (tmp_path / "01.a").write_text("2", encoding="utf-8")
+        (tmp_path / "02").write_text("3", encoding="utf-8")
+
+        pairs = importer.scan_package(tmp_path)
+
+        assert [(p.input, p.answer) for p in pairs] == [("01", "01.a"), ("02", None)]
+
+    def test_zip(self, tmp_path: Path) -> None:
+        """Test that zip archives are scanned."""
+        archive = tmp_path / "tests.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a/1.in", "x")
+            zf.writestr("a/1.ans", "y")
+
+        pairs = importer.scan_package(archive)
+
+        assert [(p.input, p.answer) for p in pairs] == [("a/1.in", "a/1.ans")]
+
+    def test_invalid_source(self, tmp_path: Path) -> None:
+        """Test that a plain file raises ValueError."""
+        f = tmp_path / "x.txt"
+        f.write_text("x", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="neither a directory nor a zip"):
+            importer.scan_package(f)
+
+
+class TestImportPackage:
+    """Tests for the import_package function."""
+
+    def test_directory(self, tmp_path: Path) -> None:
+        """Test importing a directory writes files and file-backed entries."""
+        data_dir = tmp_path / ".cph" / "data"
+        calls: list[tuple[int, int]] = []
+
+        entries = importer.import_package(
+            _make_dir_package(tmp_path),
+            data_dir,
+            base_dir=tmp_path / ".cph",
+            progress=lambda done, total: calls.append((done, total)),
+        )
+
+        assert [e["inputFile"] for e in entries] == [
+            "data/01.in",
+            "data/02.in",
+            "data/03.in",
+        ]
+        assert (data_dir / "03.in").read_text(encoding="utf-8") == "in10"
+        assert (data_dir / "03.out").read_text(encoding="utf-8") == "out10"
+        assert calls[-1] == (3, 3)
+        assert len(calls) == 3
+
+    def test_zip_many_files(self, tmp_path: Path) -> None:
+        """Test importing a zip with many tests using several threads."""
+        archive = tmp_path / "tests.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for i in range(200):
+                zf.writestr(f"{i}.in", f"in{i}")
+                if i % 2 == 0:
+                    zf.writestr(f"{i}.out", f"out{i}")
+
+        entries = importer.import_package(
+            archive,
+            tmp_path / "data",
+            base_dir=tmp_path,
+            max_workers=8,
+        )
+
+        assert len(entries) == 200
+        assert (tmp_path / entries[199]["inputFile"]).read_text() == "in199"
+        assert "outputFile" not in entries[199]
+        assert (tmp_path / entries[198]["outputFile"]).read_text() == "out198"
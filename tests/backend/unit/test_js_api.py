@@ -451,6 +451,50 @@ class TestApiRunTask:
                         api_with_tmp_path.run_task(1)
 
 
+class TestApiRunAll:
+    """Tests for the run_all method."""
+
+    def test_subtask_scoring(self, tmp_path: Path, api_with_tmp_path: Api) -> None:
+        """Test that run_all skips dependent subtasks and reports progress."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print(input())", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        api_with_tmp_path.save_testcase(
+            {
+                "subtasks": [
+                    {"name": "1", "points": 40},
+                    {"name": "2", "points": 60, "depends": ["1"]},
+                ],
+                "tests": [
+                    {"id": 1, "input": "a", "answer": "a", "subtask": "1"},
+                    {"id": 2, "input": "b", "answer": "wrong", "subtask": "1"},
+                    {"id": 3, "input": "c", "answer": "c", "subtask": "2"},
+                ],
+            },
+        )
+
+        def fake_runner(path: Path, inp: str, **kwargs: object) -> tuple:
+            return (inp, "success", 0.1, 1)
+
+        with (
+            patch("pysrc.js_api.lang_runners", {"python": fake_runner}),
+            patch("pysrc.js_api.judge_workers", return_value=1),
+            patch.object(
+                api_with_tmp_path,
+                "get_code",
+                return_value={"type": "python"},
+            ),
+            patch.object(api_with_tmp_path, "_dispatch_event") as mock_dispatch,
+        ):
+            report = api_with_tmp_path.run_all()
+
+        statuses = [r["status"] for r in report["results"]]
+        assert statuses == ["success", "failed", "skipped"]
+        assert report["score"] == 0
+        assert mock_dispatch.call_count == 3
+        assert mock_dispatch.call_args.args[0] == "judge-progress"
+
+
 class TestApiOtherMethods:
     """Tests for other Api methods."""
 
@@ -678,3 +722,266 @@ class TestApiTestcase:
 
         cph_file = tmp_path / ".cph" / ".test.py.prob"
         assert cph_file.exists()
+
+    def test_get_testcase_summary(self, tmp_path: Path, api_with_tmp_path: Api) -> None:
+        """Test get_testcase in summary mode returns sizes instead of full text."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        api_with_tmp_path.save_testcase(
+            {"tests": [{"id": 1, "input": "x" * 5000, "answer": "ok"}]},
+        )
+
+        result = api_with_tmp_path.get_testcase(summary=True)
+
+        test = result["tests"][0]
+        assert test["id"] == 1
+        assert test["input"]["size"] == 5000
+        assert test["input"]["truncated"] is True
+        assert len(test["input"]["preview"]) < 5000
+        assert test["answer"] == {
+            "size": 2,
+            "hash": test["answer"]["hash"],
+            "preview": "ok",
+            "truncated": False,
+        }
+
+    def test_get_testcase_content_range(
+        self,
+        tmp_path: Path,
+        api_with_tmp_path: Api,
+    ) -> None:
+        """Test get_testcase_content returns the requested slice."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        api_with_tmp_path.save_testcase(
+            {"tests": [{"id": 1, "input": "0123456789", "answer": ""}]},
+        )
+
+        result = api_with_tmp_path.get_testcase_content(1, "input", 2, 3)
+
+        assert result["data"] == "234"
+        assert result["size"] == 10
+        assert result["eof"] is False
+
+    def test_save_testcase_keeps_omitted_fields(
+        self,
+        tmp_path: Path,
+        api_with_tmp_path: Api,
+    ) -> None:
+        """Test save_testcase keeps stored text for fields the caller omitted."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        api_with_tmp_path.save_testcase(
+            {"tests": [{"id": 1, "input": "big input", "answer": "old"}]},
+        )
+
+        api_with_tmp_path.save_testcase({"tests": [{"id": 1, "answer": "new"}]})
+
+        result = api_with_tmp_path.get_testcase()
+        assert result["tests"][0]["input"] == "big input"
+        assert result["tests"][0]["answer"] == "new"
+
+    def test_upsert_test_appends(self, tmp_path: Path, api_with_tmp_path: Api) -> None:
+        """Test upsert_test creates the testcase file and appends a test."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+
+        api_with_tmp_path.upsert_test(1, "in", "out")
+
+        result = api_with_tmp_path.get_testcase()
+        assert result["tests"] == [{"id": 1, "input": "in", "answer": "out"}]
+        assert (tmp_path / ".cph" / ".test.py.prob.journal").exists()
+
+    def test_delete_and_reorder_tests(
+        self,
+        tmp_path: Path,
+        api_with_tmp_path: Api,
+    ) -> None:
+        """Test delete_test and reorder_tests update the testcase."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        api_with_tmp_path.save_testcase(
+            {
+                "tests": [
+                    {"id": 1, "input": "a", "answer": ""},
+                    {"id": 2, "input": "b", "answer": ""},
+                    {"id": 3, "input": "c", "answer": ""},
+                ],
+            },
+        )
+
+        api_with_tmp_path.reorder_tests([3, 2, 1])
+        api_with_tmp_path.delete_test(2)
+
+        result = api_with_tmp_path.get_testcase()
+        assert [t["input"] for t in result["tests"]] == ["c", "a"]
+
+    def test_delete_test_without_testcase(
+        self,
+        tmp_path: Path,
+        api_with_tmp_path: Api,
+    ) -> None:
+        """Test delete_test raises ValueError when there is no testcase file."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+
+        with pytest.raises(ValueError, match="does not exist"):
+            api_with_tmp_path.delete_test(1)
+
+    def test_import_testcases(self, tmp_path: Path, api_with_tmp_path: Api) -> None:
+        """Test import_testcases appends file-backed tests from a directory."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        api_with_tmp_path.save_testcase(
+            {"tests": [{"id": 1, "input": "inline", "answer": ""}]},
+        )
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "1.in").write_text("file in", encoding="utf-8")
+        (package / "1.out").write_text("file out", encoding="utf-8")
+
+        with patch.object(api_with_tmp_path, "_dispatch_event") as mock_dispatch:
+            result = api_with_tmp_path.import_testcases(str(package))
+
+        assert result["data"] == 1
+        mock_dispatch.assert_called_with(
+            "testcase-import-progress",
+            {"done": 1, "total": 1},
+        )
+        tests = api_with_tmp_path.get_testcase()["tests"]
+        assert [t["input"] for t in tests] == ["inline", "file in"]
+        assert tests[1]["answer"] == "file out"
+
+    def test_save_testcase_keeps_file_references(
+        self,
+        tmp_path: Path,
+        api_with_tmp_path: Api,
+    ) -> None:
+        """Test that omitted fields of file-backed tests stay file-backed."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "1.in").write_text("file in", encoding="utf-8")
+        with patch.object(api_with_tmp_path, "_dispatch_event"):
+            api_with_tmp_path.import_testcases(str(package))
+
+        api_with_tmp_path.save_testcase({"tests": [{"id": 1, "answer": "new"}]})
+
+        problem = api_with_tmp_path._get_testcase_store().problem()  # type: ignore[union-attr]
+        assert "inputFile" in problem["tests"][0]
+        assert problem["tests"][0]["output"] == "new"
+
+    def test_run_task_with_generator(
+        self,
+        tmp_path: Path,
+        api_with_tmp_path: Api,
+    ) -> None:
+        """Test run_task feeds the materialized generator output as input."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print(input())", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        generated = tmp_path / "generated.in"
+        generated.write_text("generated input", encoding="utf-8")
+        mock_runner = MagicMock(return_value=("out", "success", 0.1, 10))
+        testcase = {
+            "tests": [
+                {
+                    "id": 1,
+                    "input": "",
+                    "answer": "out",
+                    "generator": {"source": "gen.py", "args": [5]},
+                },
+            ],
+        }
+
+        with (
+            patch("pysrc.js_api.lang_runners", {"python": mock_runner}),
+            patch.object(
+                api_with_tmp_path, "get_code", return_value={"type": "python"}
+            ),
+            patch.object(api_with_tmp_path, "get_testcase", return_value=testcase),
+            patch.object(
+                api_with_tmp_path.generator_cache,
+                "materialize",
+                return_value=generated,
+            ) as mock_materialize,
+        ):
+            result = api_with_tmp_path.run_task(1)
+
+        assert result["status"] == "success"
+        mock_materialize.assert_called_once_with(tmp_path / "gen.py", ["5"])
+        assert mock_runner.call_args.args[1] == "generated input"
+
+
+class TestApiFillAnswers:
+    """Tests for the fill_answers method."""
+
+    def test_fill_missing_answers(self, tmp_path: Path, api_with_tmp_path: Api) -> None:
+        """Test that only tests without answers are run and filled in one batch."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print(input())", encoding="utf-8")
+        reference = tmp_path / "brute.py"
+        reference.write_text("print(input())", encoding="utf-8")
+        api_with_tmp_path.opened_file = test_file
+        api_with_tmp_path.save_testcase(
+            {
+                "tests": [
+                    {"id": 1, "input": "1", "answer": "kept"},
+                    {"id": 2, "input": "2", "answer": ""},
+                    {"id": 3, "input": "3", "answer": " \n"},
+                    {"id": 4, "input": "crash", "answer": ""},
+                ],
+            },
+        )
+
+        def fake_runner(path: Path, inp: str, **kwargs: object) -> tuple:
+            if inp == "crash":
+                return ("boom", "runtime_error", 0.1, 1)
+            return (f"ans{inp}", "success", 0.1, 1)
+
+        mock_compile = MagicMock()
+        with (
+            patch("pysrc.js_api.lang_runners", {"python": fake_runner}),
+            patch("pysrc.js_api.lang_compilers", {"python": mock_compile}),
+            patch("pysrc.js_api.type_mp", {".py": {"id": "python"}}),
+            patch("pysrc.js_api.judge_workers", return_value=2),
+        ):
+            result = api_with_tmp_path.fill_answers(str(reference))
+
+        mock_compile.assert_called_once_with(reference)
+        assert result["status"] == "warning"
+        assert result["data"]["filled"] == [2, 3]
+        assert result["data"]["failed"] == [{"id": 4, "status": "runtime_error"}]
+        answers = [t["answer"] for t in api_with_tmp_path.get_testcase()["tests"]]
+        assert answers == ["kept", "ans2", "ans3", ""]
+
+    def test_compile_error(self, tmp_path: Path, api_with_tmp_path: Api) -> None:
+        """Test that a reference compile error is reported."""
+        api_with_tmp_path.opened_file = tmp_path / "test.py"
+        with (
+            patch("pysrc.js_api.lang_runners", {"python": MagicMock()}),
+            patch(
+                "pysrc.js_api.lang_compilers",
+                {"python": MagicMock(side_effect=RuntimeError("bad code"))},
+            ),
+            patch("pysrc.js_api.type_mp", {".py": {"id": "python"}}),
+        ):
+            result = api_with_tmp_path.fill_answers(str(tmp_path / "brute.py"))
+
+        assert result == {"status": "error", "message": "bad code"}
+
+    def test_cancelled_dialog(self, api_with_tmp_path: Api) -> None:
+        """Test that cancelling the file dialog returns a warning."""
+        with patch.object(api_with_tmp_path, "_choose_file", return_value=None):
+            result = api_with_tmp_path.fill_answers()
+
+        assert result["status"] == "warning"
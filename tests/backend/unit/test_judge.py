@@ -4,7 +4,10 @@ This module contains unit tests for the task_checker and cph2testcase functions
 in the judge module.
 """
 
-from pysrc.judge import cph2testcase, task_checker
+from pathlib import Path
+from unittest.mock import patch
+
+from pysrc.judge import cph2testcase, judge_workers, task_checker
 
 
 class TestTaskChecker:
@@ -201,3 +204,57 @@ class TestCph2testcase:
 
         for i, test in enumerate(result["tests"], start=1):
             assert test["id"] == i
+
+    def test_file_backed_tests(self, tmp_path: Path) -> None:
+        """Test that file references are resolved relative to base_dir."""
+        (tmp_path / "1.in").write_text("from file", encoding="utf-8")
+        cph_json = {
+            "tests": [
+                {"input": "", "output": "inline", "inputFile": "1.in"},
+                {"input": "fallback", "output": "", "inputFile": "missing.in"},
+            ],
+        }
+        result = cph2testcase(cph_json, tmp_path)
+
+        assert result["tests"][0]["input"] == "from file"
+        assert result["tests"][0]["answer"] == "inline"
+        assert result["tests"][1]["input"] == "fallback"
+
+    def test_generator_spec_passed_through(self) -> None:
+        """Test that generator specs are kept on converted tests."""
+        spec = {"source": "gen.cpp", "args": ["10"]}
+        result = cph2testcase({"tests": [{"generator": spec, "output": ""}]})
+
+        assert result["tests"][0]["generator"] == spec
+        assert result["tests"][0]["input"] == ""
+
+    def test_subtasks_passed_through(self) -> None:
+        """Test that subtask definitions and memberships are kept."""
+        subtasks = [{"name": "1", "points": 40}, {"name": "2", "points": 60}]
+        result = cph2testcase(
+            {
+                "subtasks": subtasks,
+                "tests": [{"input": "", "output": "", "subtask": 2}, {"input": ""}],
+            },
+        )
+
+        assert result["subtasks"] == subtasks
+        assert result["tests"][0]["subtask"] == "2"
+        assert "subtask" not in result["tests"][1]
+
+
+class TestJudgeWorkers:
+    """Tests for the judge_workers function."""
+
+    def test_without_smt(self) -> None:
+        """Test 1.5x physical cores when logical equals physical."""
+        with patch("pysrc.judge.psutil.cpu_count", return_value=4):
+            assert judge_workers() == 6
+
+    def test_with_smt(self) -> None:
+        """Test one worker per physical core with SMT."""
+        with patch(
+            "pysrc.judge.psutil.cpu_count",
+            side_effect=lambda logical=True: 8 if logical else 4,
+        ):
+            assert judge_workers() == 4
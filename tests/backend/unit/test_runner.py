@@ -5,6 +5,7 @@ Since runner.py uses subprocess and psutil, we use mocks to avoid real
 process execution.
 """
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -156,6 +157,33 @@ class TestRunP:
 
         assert result.status == "memory_limit_exceeded"
 
+    @patch.object(runner.psutil, "Popen")
+    @patch("pysrc.runner.time")
+    def test_cancelled(
+        self,
+        mock_time: MagicMock,
+        mock_popen: MagicMock,
+    ) -> None:
+        """Test that setting the cancel event kills the process."""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None  # Still running
+        mock_process.memory_full_info.return_value = MagicMock(uss=1024 * 1024)
+        mock_process.cpu_times.return_value = MagicMock(
+            children_user=0,
+            children_system=0,
+            user=0.1,
+            system=0.0,
+        )
+        mock_popen.return_value.__enter__.return_value = mock_process
+        mock_time.monotonic.side_effect = [0, 0.1]
+        cancel = threading.Event()
+        cancel.set()
+
+        result = runner.run_p(["sleep", "10"], cancel_event=cancel)
+
+        assert result.status == "cancelled"
+        mock_process.kill.assert_called()
+
 
 class TestRun:
     """Tests for the run function."""
@@ -558,3 +586,38 @@ class TestRunC_Cpp:
 
         mock_run.assert_called_once()
         assert result.type == "success"
+
+
+class TestArtifactPath:
+    """Tests for the artifact_path function."""
+
+    def test_compiled_binary(self, tmp_path: Path) -> None:
+        """Test that the binary named by the run command is found."""
+        source = tmp_path / "a.cpp"
+        source.touch()
+        (tmp_path / "a.out").touch()
+
+        result = runner.artifact_path(source, "{fileWithoutExt}.out")
+
+        assert result == tmp_path / "a.out"
+
+    def test_interpreter_argument(self, tmp_path: Path) -> None:
+        """Test that the first existing file argument is used."""
+        source = tmp_path / "a.py"
+        source.touch()
+        (tmp_path / "a.pyc").touch()
+
+        result = runner.artifact_path(
+            source,
+            "{executable} {fileStem}.pyc",
+            executable="python3",
+        )
+
+        assert result == tmp_path / "a.pyc"
+
+    def test_fallback_to_source(self, tmp_path: Path) -> None:
+        """Test that the source is returned when no artifact exists."""
+        source = tmp_path / "a.cpp"
+        source.touch()
+
+        assert runner.artifact_path(source, "{fileWithoutExt}.out") == source
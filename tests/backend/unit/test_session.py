@@ -0,0 +1,134 @@
+"""Unit tests for the session module."""
+
+import threading
+
+import pytest
+
+from pysrc import session
+
+SUBTASKS = [
+    {"name": "1", "points": 20},
+    {"name": "2", "points": 30, "depends": ["1"]},
+    {"name": "3", "points": 50},
+]
+
+
+def make_tests(spec: list[tuple[str | None, str]]) -> list[dict]:
+    """Build tests from (subtask, input) pairs."""
+    tests = []
+    for i, (subtask, inp) in enumerate(spec, start=1):
+        test = {"id": i, "input": inp, "answer": ""}
+        if subtask is not None:
+            test["subtask"] = subtask
+        tests.append(test)
+    return tests
+
+
+def verdict_by_input(test: dict, cancel: threading.Event) -> dict:
+    """Accept tests whose input is "ok" and reject the others."""
+    return {"status": "success" if test["input"] == "ok" else "failed"}
+
+
+class TestSubtaskDependents:
+    """Tests for the subtask_dependents function."""
+
+    def test_transitive(self) -> None:
+        """Test that dependents are collected transitively."""
+        closure = session.subtask_dependents(
+            [
+                {"name": "a"},
+                {"name": "b", "depends": ["a"]},
+                {"name": "c", "depends": ["b"]},
+            ],
+        )
+        assert closure == {"a": {"a", "b", "c"}, "b": {"b", "c"}, "c": {"c"}}
+
+    def test_unknown_dependency(self) -> None:
+        """Test that depending on an unknown subtask is rejected."""
+        with pytest.raises(ValueError, match="unknown subtask"):
+            session.subtask_dependents([{"name": "a", "depends": ["x"]}])
+
+
+class TestJudgeSession:
+    """Tests for the JudgeSession class."""
+
+    def test_all_pass(self) -> None:
+        """Test that passing every test awards every subtask."""
+        tests = make_tests([("1", "ok"), ("2", "ok"), ("3", "ok"), (None, "ok")])
+        report = session.JudgeSession(
+            tests,
+            verdict_by_input,
+            subtasks=SUBTASKS,
+        ).run()
+        assert report["score"] == 100
+        assert [r["id"] for r in report["results"]] == [1, 2, 3, 4]
+        assert all(r["status"] == "success" for r in report["results"])
+
+    def test_failure_skips_subtask_and_dependents(self) -> None:
+        """Test that a failure skips its subtask and the subtasks depending on it."""
+        tests = make_tests(
+            [("2", "ok"), ("1", "ok"), ("1", "bad"), ("1", "ok"), ("3", "ok")],
+        )
+        ran = []
+
+        def run_test(test: dict, cancel: threading.Event) -> dict:
+            ran.append(test["id"])
+            return verdict_by_input(test, cancel)
+
+        published = []
+        report = session.JudgeSession(
+            tests,
+            run_test,
+            subtasks=SUBTASKS,
+            on_result=published.append,
+        ).run()
+
+        statuses = {r["id"]: r["status"] for r in report["results"]}
+        assert statuses == {
+            1: "skipped",
+            2: "success",
+            3: "failed",
+            4: "skipped",
+            5: "success",
+        }
+        assert 1 not in ran
+        assert 4 not in ran
+        assert len(published) == 5
+        assert {s["name"]: s["score"] for s in report["subtasks"]} == {
+            "1": 0,
+            "2": 0,
+            "3": 50,
+        }
+        assert report["score"] == 50
+
+    def test_in_flight_tests_are_cancelled(self) -> None:
+        """Test that running tests of a failed subtask are cancelled."""
+        tests = make_tests([("1", "slow"), ("1", "bad")])
+        started = threading.Event()
+
+        def run_test(test: dict, cancel: threading.Event) -> dict:
+            if test["input"] == "slow":
+                started.set()
+                assert cancel.wait(5)
+                return {"status": "cancelled"}
+            started.wait(5)
+            return {"status": "failed"}
+
+        report = session.JudgeSession(
+            tests,
+            run_test,
+            subtasks=SUBTASKS,
+            workers=2,
+        ).run()
+        statuses = {r["id"]: r["status"] for r in report["results"]}
+        assert statuses == {1: "skipped", 2: "failed"}
+
+    def test_crash_counts_as_failure(self) -> None:
+        """Test that an exception in run_test fails the test instead of the session."""
+
+        def run_test(test: dict, cancel: threading.Event) -> dict:
+            raise RuntimeError("boom")
+
+        report = session.JudgeSession(make_tests([(None, "ok")]), run_test).run()
+        assert report["results"][0]["status"] == "runtime_error"
+        assert report["score"] == 0
@@ -0,0 +1,226 @@
+"""Unit tests for the testcase module.
+
+This module contains unit tests for the summary and ranged read helpers
+used to transport testcases to the frontend lazily.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pysrc import testcase
+
+TESTCASE = {
+    "name": "A",
+    "tests": [
+        {"id": 1, "input": "1 2\n", "answer": "3\n"},
+        {"id": 2, "input": "a" * 100, "answer": ""},
+    ],
+    "memoryLimit": 256,
+    "timeLimit": 1,
+}
+
+
+class TestFieldSummary:
+    """Tests for the field_summary function."""
+
+    def test_short_text(self) -> None:
+        """Test that short text is previewed in full."""
+        result = testcase.field_summary("hello")
+        assert result["size"] == 5
+        assert result["preview"] == "hello"
+        assert result["truncated"] is False
+
+    def test_long_text_is_truncated(self) -> None:
+        """Test that long text is cut to the preview length."""
+        result = testcase.field_summary("a" * 100, preview_length=10)
+        assert result["size"] == 100
+        assert result["preview"] == "a" * 10
+        assert result["truncated"] is True
+
+    def test_hash_depends_on_content(self) -> None:
+        """Test that different content yields different hashes."""
+        assert (
+            testcase.field_summary("a")["hash"] != testcase.field_summary("b")["hash"]
+        )
+        assert (
+            testcase.field_summary("a")["hash"] == testcase.field_summary("a")["hash"]
+        )
+
+
+class TestTestcaseSummary:
+    """Tests for the testcase_summary function."""
+
+    def test_keeps_metadata(self) -> None:
+        """Test that problem metadata is preserved."""
+        result = testcase.testcase_summary(TESTCASE)
+        assert result["name"] == "A"
+        assert result["memoryLimit"] == 256
+        assert [t["id"] for t in result["tests"]] == [1, 2]
+
+    def test_does_not_mutate_input(self) -> None:
+        """Test that the original testcase is left untouched."""
+        testcase.testcase_summary(TESTCASE, preview_length=1)
+        assert TESTCASE["tests"][1]["input"] == "a" * 100
+
+
+class TestReadField:
+    """Tests for the read_field function."""
+
+    def test_read_whole_field(self) -> None:
+        """Test reading a field without a length returns the rest."""
+        result = testcase.read_field(TESTCASE, 1, "input")
+        assert result["data"] == "1 2\n"
+        assert result["eof"] is True
+
+    def test_read_range(self) -> None:
+        """Test reading a bounded range."""
+        result = testcase.read_field(TESTCASE, 2, "input", 90, 20)
+        assert result["data"] == "a" * 10
+        assert result["offset"] == 90
+        assert result["eof"] is True
+
+    def test_unknown_field(self) -> None:
+        """Test that unknown fields raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown testcase field"):
+            testcase.read_field(TESTCASE, 1, "output")
+
+    def test_negative_offset(self) -> None:
+        """Test that negative offsets raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid range"):
+            testcase.read_field(TESTCASE, 1, "input", -1)
+
+    def test_missing_test(self) -> None:
+        """Test that a missing test raises KeyError."""
+        with pytest.raises(KeyError):
+            testcase.read_field(TESTCASE, 3, "input")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> testcase.TestcaseStore:
+    """Create a store over a problem file with two tests."""
+    path = tmp_path / ".a.cpp.prob"
+    path.write_text(
+        json.dumps(
+            {
+                "name": "A",
+                "tests": [
+                    {"id": 1, "input": "1", "output": "one"},
+                    {"id": 2, "input": "2", "output": "two"},
+                ],
+            },
+        ),
+        encoding="utf-8",
+    )
+    return testcase.TestcaseStore(path, compact_delay=3600)
+
+
+class TestTestcaseStore:
+    """Tests for the TestcaseStore class."""
+
+    def test_upsert_is_journaled(self, store: testcase.TestcaseStore) -> None:
+        """Test that an upsert is applied in memory and appended to the journal."""
+        before = store.path.read_text(encoding="utf-8")
+
+        store.upsert_test(2, answer="TWO")
+
+        assert store.testcase()["tests"][1]["answer"] == "TWO"
+        assert store.path.read_text(encoding="utf-8") == before
+        assert len(store.journal_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_upsert_appends(self, store: testcase.TestcaseStore) -> None:
+        """Test that upserting one past the last test appends a new test."""
+        store.upsert_test(3, "3")
+
+        tests = store.testcase()["tests"]
+        assert len(tests) == 3
+        assert tests[2] == {"id": 3, "input": "3", "answer": ""}
+
+    def test_upsert_out_of_range(self, store: testcase.TestcaseStore) -> None:
+        """Test that upserting far past the end raises ValueError."""
+        with pytest.raises(ValueError, match="does not exist"):
+            store.upsert_test(5, "5")
+        assert not store.journal_path.exists()
+
+    def test_delete_and_reorder(self, store: testcase.TestcaseStore) -> None:
+        """Test delete and reorder operations."""
+        store.upsert_test(3, "3")
+        store.reorder_tests([3, 1, 2])
+        store.delete_test(2)
+
+        assert [t["input"] for t in store.testcase()["tests"]] == ["3", "2"]
+
+    def test_invalid_reorder(self, store: testcase.TestcaseStore) -> None:
+        """Test that an order that is not a permutation raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid test order"):
+            store.reorder_tests([1, 1])
+
+    def test_journal_replayed_on_load(self, store: testcase.TestcaseStore) -> None:
+        """Test that a fresh store replays the journal left by another one."""
+        store.upsert_test(1, "changed")
+
+        reloaded = testcase.TestcaseStore(store.path, compact_delay=3600)
+
+        assert reloaded.testcase()["tests"][0]["input"] == "changed"
+
+    def test_compact(self, store: testcase.TestcaseStore) -> None:
+        """Test that compaction folds the journal into the problem file."""
+        store.upsert_test(1, "changed")
+        store.delete_test(2)
+
+        store.compact()
+
+        assert not store.journal_path.exists()
+        data = json.loads(store.path.read_text(encoding="utf-8"))
+        assert [t["input"] for t in data["tests"]] == ["changed"]
+        assert data[testcase.JOURNAL_SEQ_KEY] == 2
+
+    def test_stale_journal_not_reapplied(self, store: testcase.TestcaseStore) -> None:
+        """Test that entries already compacted are skipped on replay."""
+        store.delete_test(1)
+        journal = store.journal_path.read_text(encoding="utf-8")
+        store.compact()
+        # Simulate a crash between writing the problem and dropping the journal
+        store.journal_path.write_text(journal, encoding="utf-8")
+
+        reloaded = testcase.TestcaseStore(store.path, compact_delay=3600)
+
+        assert [t["input"] for t in reloaded.testcase()["tests"]] == ["2"]
+
+    def test_truncated_journal_line_ignored(
+        self, store: testcase.TestcaseStore
+    ) -> None:
+        """Test that a partially written journal entry is ignored."""
+        store.upsert_test(1, "changed")
+        with store.journal_path.open("a", encoding="utf-8") as f:
+            f.write('{"seq": 2, "op": "del')
+
+        reloaded = testcase.TestcaseStore(store.path, compact_delay=3600)
+
+        assert len(reloaded.testcase()["tests"]) == 2
+
+    def test_replace_clears_journal(self, store: testcase.TestcaseStore) -> None:
+        """Test that replacing the problem drops the pending journal."""
+        store.upsert_test(1, "changed")
+
+        store.replace({"name": "B", "tests": []})
+
+        assert not store.journal_path.exists()
+        assert store.testcase()["name"] == "B"
+
+    def test_external_change_reloaded(self, store: testcase.TestcaseStore) -> None:
+        """Test that external rewrites are picked up when nothing is pending."""
+        store.testcase()
+        store.path.write_text(json.dumps({"name": "C", "tests": []}), encoding="utf-8")
+
+        assert store.testcase()["name"] == "C"
+
+    def test_upsert_tests_single_entry(self, store: testcase.TestcaseStore) -> None:
+        """Test that a batch of upserts is journaled as one entry."""
+        store.upsert_tests([{"id": 1, "answer": "A"}, {"id": 2, "answer": "B"}])
+
+        assert [t["answer"] for t in store.testcase()["tests"]] == ["A", "B"]
+        assert len(store.journal_path.read_text(encoding="utf-8").splitlines()) == 1
+        reloaded = testcase.TestcaseStore(store.path, compact_delay=3600)
+        assert [t["answer"] for t in reloaded.testcase()["tests"]] == ["A", "B"]